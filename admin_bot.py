@@ -1,7 +1,6 @@
 """Telegram Bot Admin Panel for managing the forwarder configuration."""
 import telebot
 from telebot import types
-import json
 import os
 import time
 import asyncio
@@ -9,6 +8,7 @@ from pathlib import Path
 from telethon import TelegramClient
 from telethon.errors import SessionPasswordNeededError, PhoneCodeInvalidError, FloodWaitError, PhoneMigrateError
 from src.config_manager import ConfigManager
+from src.backfill_tracking import BackfillTracking
 from worker_manager import WorkerManager, WorkerProcess
 
 # Load configuration
@@ -321,22 +321,13 @@ def process_add_channel_pair(message):
             config_manager.config = config
             config_manager.save()
             
-            # Mark pair for backfill by removing it from backfill_tracking.json
-            backfill_tracking_file = Path("backfill_tracking.json")
+            # Mark pair for backfill by removing it from backfill tracking
             try:
-                if backfill_tracking_file.exists():
-                    with open(backfill_tracking_file, 'r') as f:
-                        backfill_tracking = json.load(f)
-                else:
-                    backfill_tracking = {}
+                backfill_tracking = BackfillTracking()
+                backfill_tracking.load()
                 
                 # Remove the pair key if it exists (to trigger backfill)
-                pair_key = f"{source}:{target}"
-                if pair_key in backfill_tracking:
-                    del backfill_tracking[pair_key]
-                    
-                    with open(backfill_tracking_file, 'w') as f:
-                        json.dump(backfill_tracking, f, indent=2)
+                backfill_tracking.unmark((source, target))
             except Exception as e:
                 logger.warning(f"Could not update backfill tracking: {e}")
             
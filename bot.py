@@ -1,12 +1,19 @@
 """Main Telegram forwarder bot with multi-channel support."""
+import argparse
 import asyncio
+import functools
+import io
 import json
+import logging
 import os
+import random
 import shutil
 import sqlite3
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from telethon import TelegramClient, events
 from telethon.errors import (
     FloodWaitError, 
@@ -14,19 +21,86 @@ from telethon.errors import (
     ChannelPrivateError,
     ChatWriteForbiddenError,
     SlowModeWaitError,
-    ChatForwardsRestrictedError
+    ChatForwardsRestrictedError,
+    RPCError
 )
 from telethon.tl.types import Message, MessageMediaDocument, DocumentAttributeSticker, DocumentAttributeAnimated
 
+from src import json_io
+from src.backfill_tracking import BackfillTracking, PairKey, format_pair_key, parse_pair_key
 from src.config_manager import ConfigManager
+from src.dedup import BloomDedup
+from src.rate_limiter import TokenBucket
 from src.text_processor import TextProcessor
+from src.trigger_watcher import TriggerWatcher
 from src.logger_setup import setup_logger, get_logger
 
+# Chunk size for streamed media transfers (iter_download would default to 512 KB)
+_STREAM_CHUNK_SIZE = 128 * 1024
+
+# Document attribute types that mark stickers/animations (TL types are never subclassed)
+_STICKER_ATTR_TYPES = frozenset({DocumentAttributeSticker, DocumentAttributeAnimated})
+
+
+class _LazyForwardRepr:
+    """Describes a message's forward header for debug logs, built only when emitted."""
+    
+    __slots__ = ("forward",)
+    
+    def __init__(self, forward: Any):
+        self.forward = forward
+    
+    def __str__(self) -> str:
+        fwd = self.forward
+        fields = ", ".join(
+            f"{name}: {getattr(fwd, name, 'NOT FOUND')}"
+            for name in ("from_id", "from_name", "channel_post", "chat_id", "saved_from_peer", "saved_from_msg_id")
+        )
+        return f"type: {type(fwd)}, {fields}"
+
+
+class _ChunkReader:
+    """
+    Async file-like view over a queue of downloaded chunks, for client.upload_file.
+    
+    upload_file asks for fixed-size parts, so chunks are re-cut to whatever size
+    read() is called with. A None in the queue marks the end of the download; an
+    exception is re-raised to the uploader.
+    """
+    
+    def __init__(self, queue: "asyncio.Queue[Any]", name: str):
+        self.name = name
+        self._queue = queue
+        self._buffer = bytearray()
+        self._eof = False
+    
+    async def read(self, n: int = -1) -> bytes:
+        while not self._eof and (n < 0 or len(self._buffer) < n):
+            chunk = await self._queue.get()
+            if chunk is None:
+                self._eof = True
+            elif isinstance(chunk, BaseException):
+                raise chunk
+            else:
+                self._buffer += chunk
+        if n < 0:
+            n = len(self._buffer)
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
 
 class TelegramForwarder:
     """Main forwarder bot class."""
     
-    def __init__(self, config_path_or_dict = "config.json"):
+    # Core attribute types declared up front (needed to compile this module with mypyc)
+    config_manager: ConfigManager
+    config: Dict[str, Any]
+    logger: logging.Logger
+    text_processor: TextProcessor
+    client: TelegramClient
+    
+    def __init__(self, config_path_or_dict: Union[str, Dict[str, Any]] = "config.json"):
         """
         Initialize TelegramForwarder.
         
@@ -62,50 +136,135 @@ class TelegramForwarder:
         # Initialize Telegram client
         self.client = TelegramClient(self.session_name, self.api_id, self.api_hash)
         
-        # Track forwarded messages to avoid duplicates
-        self.forwarded_messages: Set[int] = set()
+        # Track handled live messages to avoid duplicates, by (source, message_id), in
+        # constant memory; backs up last_processed_ids if it fails to save or goes back
+        self.forwarded_messages = BloomDedup(window_seconds=settings.get("dedup_window", 3600))
+        
+        # Track processed media groups to avoid duplicates (LRU of the last 100 groups)
+        self.processed_groups: "OrderedDict[int, None]" = OrderedDict()
+        self.max_processed_groups = 100
         
-        # Track processed media groups to avoid duplicates
-        self.processed_groups: Set[int] = set()
+        # Recently fetched album members by grouped_id, so forwarding the same album
+        # to several targets fetches it once; entries expire after a few seconds
+        self._group_cache: Dict[int, List[Message]] = {}
+        self._group_cache_ttl = 5
         
-        # Track registered source channels for event handler
+        # Sticker detection results by document ID (LRU); sticker packs get reposted a lot
+        self._sticker_docs: "OrderedDict[int, bool]" = OrderedDict()
+        self.max_sticker_docs = 4096
+        
+        # Channel entities resolved at startup (or first use), by ID
+        self._entity_cache: Dict[int, Any] = {}
+        
+        # IDs of the enabled source channels; event handlers filter on this in the dispatcher
         self.registered_source_channels: Set[int] = set()
         
         # Track last received message ID for each channel (for heartbeat monitoring)
         self.last_received_msg_ids: Dict[int, int] = {}
         
-        # Map source message IDs to target message IDs for reply preservation
-        # Key: f"{source_channel_id}:{source_msg_id}" -> Value: target_msg_id
-        self.message_id_map: Dict[str, int] = {}
+        # Snapshots of filters and enabled pairs, rebuilt only when the config version
+        # changes (source -> targets routing is indexed by ConfigManager.get_targets_for)
+        self._config_version = -1
+        self._filters: Dict[str, Any] = {}
+        self._channel_pairs: List[Dict[str, Any]] = []
+        
+        # Pairs that failed with a permanent error (private, no write access, restricted):
+        # (source, target) -> (reason, monotonic expiry), LRU-bounded
+        self._dead_pairs: "OrderedDict[Tuple[int, int], Tuple[str, float]]" = OrderedDict()
         
         # Get settings
         self.retry_attempts = settings.get("retry_attempts", 5)
         self.retry_delay = settings.get("retry_delay", 5)
         self.flood_wait_extra = settings.get("flood_wait_extra_delay", 10)
+        # Give up on a message instead of sleeping through FloodWaits longer than this
+        self.max_flood_wait = settings.get("max_flood_wait", 300)
+        # Upper bound for the exponential retry delay on other errors
+        self.max_backoff = settings.get("max_backoff", 60)
+        # How long (seconds) a pair that hit a permanent error is skipped before trying again
+        self.dead_pair_ttl = settings.get("dead_pair_ttl", 600)
         self.max_message_length = settings.get("max_message_length", 4096)
         self.add_source_link = settings.get("add_source_link", False)
         self.source_link_text = settings.get("source_link_text", "\n\n🔗 Source: {link}")
+        # Split the template around its {link} placeholder once; anything fancier
+        # (escaped braces, other fields) keeps going through str.format
+        link_prefix, has_link, link_suffix = self.source_link_text.partition("{link}")
+        if has_link and not any(c in link_prefix + link_suffix for c in "{}"):
+            self._link_parts: Optional[Tuple[str, str]] = (link_prefix, link_suffix)
+        else:
+            self._link_parts = None
+        self._link_channel_ids: Dict[int, str] = {}
+        
+        # Proactive rate limiting for sends (live and backfill) so we stay under
+        # Telegram's limits instead of bouncing off FloodWait errors
+        self.per_chat_rate_limit = settings.get("per_chat_rate_limit", 1)
+        self._global_bucket = TokenBucket(settings.get("global_rate_limit", 30), 1.0)
+        self._per_chat_buckets: Dict[int, TokenBucket] = {}
         
-        # Create temp directory for media downloads
+        # Backfill copy workers; more than 1 is faster but can post messages out of order
+        self.backfill_concurrency = max(1, settings.get("backfill_concurrency", 1))
+        # Runs a backfill message may fail in before it is skipped for good
+        self.backfill_max_attempts = max(1, settings.get("backfill_max_attempts", 3))
+        # Backfill always copies with the same flag; bind it once
+        self._forward_backfill = functools.partial(self.forward_message_with_retry, is_backfill=True)
+        
+        # Single-message send path by media type (anything not listed goes to _send_media)
+        self._media_dispatch = {
+            type(None): self._send_text,
+            MessageMediaDocument: self._send_document,
+        }
+        
+        # Per-message [TIMING] logs are opt-in (ADDRESSER_TIMING=1)
+        self._timing_enabled = os.getenv("ADDRESSER_TIMING", "0") == "1"
+        
+        # Temp directory for media downloads; created on the first download that
+        # needs disk (media too big for memory that can't be streamed)
         self.temp_media_dir = Path("temp_media")
-        self.temp_media_dir.mkdir(exist_ok=True)
+        self._temp_media_dir_ready = False
+        
+        # Copy unmodified messages with a server-side forward (drop_author) when possible
+        self.server_side_copy = settings.get("server_side_copy", True)
+        
+        # Media up to this size (bytes) is downloaded into memory instead of temp_media
+        self.in_memory_media_limit = settings.get("in_memory_media_limit", 50 * 1024 * 1024)
+        # ...and an album keeps at most this many bytes of its members in memory at once
+        self.album_memory_limit = settings.get("album_memory_limit", 50 * 1024 * 1024)
+        
+        # Larger media is re-uploaded while it downloads instead of via temp_media;
+        # at most this many download chunks (128 KB each) are buffered in between
+        self.stream_media_upload = settings.get("stream_media_upload", True)
+        self.stream_buffer_chunks = settings.get("stream_buffer_chunks", 32)
+        
+        # Downloaded media is deleted by a background janitor, not inline in the send path
+        self.temp_media_ttl = settings.get("temp_media_ttl", 3600)
+        self._cleanup_queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._cleanup_task: Optional[asyncio.Task] = None
         
         # Track last processed message ID for each channel (for polling mode)
         self.last_processed_file = Path("last_processed.json")
         self.last_processed_ids: Dict[int, int] = self._load_last_processed()
         
         # Track backfilled pairs to avoid re-backfilling on restart
-        # Format: {"source:target": timestamp}
+        # Format: {"source:target": timestamp}, snapshot plus append-only journal
         self.backfill_tracking_file = Path("backfill_tracking.json")
-        self.backfilled_pairs: Dict[str, float] = self._load_backfill_tracking()
+        self.backfill_tracking = BackfillTracking(self.backfill_tracking_file)
+        self.backfilled_pairs: Dict[PairKey, float] = self._load_backfill_tracking()
         
-        # Persist message ID mapping for deletion sync (survives restarts)
+        # Checkpoint of an unfinished backfill, so a restart resumes where it stopped
+        # Format: {"source:target": {"after": message_id, "grouped_id": ..., "max_id": ...,
+        #          "failed": {"message_id": attempts}}}
+        self.backfill_progress_file = Path("backfill_progress.json")
+        self.backfill_progress: Dict[PairKey, Dict[str, Any]] = self._load_backfill_progress()
+        
+        # Persist message ID mapping for deletion sync and reply chains (survives restarts)
+        # Key: (source_id, source_msg_id) -> {"target_id": ..., "target_msg_id": ..., "timestamp": ...}
         self.message_id_map_file = Path("message_id_map.json")
-        self.message_id_map: Dict[str, Dict[str, int]] = self._load_message_id_map()
-        # Format: {"source_id:message_id": {"target_id": target_msg_id, "timestamp": 123456}}
+        # Kept in insertion (= timestamp) order so the oldest entries can be evicted first
+        self.message_id_map: "OrderedDict[Tuple[int, int], Dict[str, Any]]" = self._load_message_id_map()
         
         # File-based trigger for config reload (created by admin bot)
         self.config_reload_trigger_file = Path("trigger_reload.flag")
+        self._trigger_path_str = str(self.config_reload_trigger_file)
+        self._trigger_watcher = TriggerWatcher(self.config_reload_trigger_file)
         
         # Track config file modification time for auto-reload
         self.config_file_mtime = self._get_config_mtime()
@@ -184,27 +343,60 @@ class TelegramForwarder:
         except Exception as e:
             self.logger.error(f"Failed to save last processed IDs: {e}")
     
-    def _load_backfill_tracking(self) -> Dict[str, float]:
+    def _load_backfill_tracking(self) -> Dict[PairKey, float]:
         """Load backfill tracking data from file."""
-        if self.backfill_tracking_file.exists():
+        try:
+            self.backfill_tracking.load()
+            # Fold any journal left from the last run into the snapshot
+            self.backfill_tracking.compact()
+        except Exception as e:
+            self.logger.warning(f"Failed to load backfill tracking: {e}")
+        return self.backfill_tracking.pairs
+    
+    def _mark_backfilled(self, pair_key: PairKey) -> None:
+        """Record a pair as backfilled (one journal append)."""
+        try:
+            self.backfill_tracking.mark(pair_key, time.time())
+        except Exception as e:
+            self.logger.error(f"Failed to save backfill tracking: {e}")
+    
+    def _load_backfill_progress(self) -> Dict[PairKey, Dict[str, Any]]:
+        """Load backfill resume checkpoints from file."""
+        if self.backfill_progress_file.exists():
             try:
-                with open(self.backfill_tracking_file, 'r') as f:
-                    return json.load(f)
+                with open(self.backfill_progress_file, 'rb') as f:
+                    data = json_io.loads(f.read())
+                progress = {}
+                for key, checkpoint in data.items():
+                    if isinstance(checkpoint, list):
+                        # Older [message_id, grouped_id] entries; the window is recomputed
+                        checkpoint = {"after": checkpoint[0], "grouped_id": checkpoint[1], "max_id": None}
+                    checkpoint.setdefault("failed", {})
+                    progress[parse_pair_key(key)] = checkpoint
+                return progress
             except Exception as e:
-                self.logger.warning(f"Failed to load backfill tracking: {e}")
+                self.logger.warning(f"Failed to load backfill progress: {e}")
         return {}
     
-    def _save_backfill_tracking(self) -> None:
-        """Save backfill tracking data to file."""
+    def _save_backfill_progress(self) -> None:
+        """Save backfill resume checkpoints to file."""
         try:
-            with open(self.backfill_tracking_file, 'w') as f:
-                json.dump(self.backfilled_pairs, f, indent=2)
+            with open(self.backfill_progress_file, 'wb') as f:
+                data = {format_pair_key(key): checkpoint for key, checkpoint in self.backfill_progress.items()}
+                f.write(json_io.dumps(data))
         except Exception as e:
-            self.logger.error(f"Failed to save backfill tracking: {e}")
+            self.logger.error(f"Failed to save backfill progress: {e}")
+    
+    def _get_pair_key(self, source: int, target: int) -> PairKey:
+        """Generate a unique key for a channel pair ("source:target" once persisted)."""
+        return (source, target)
     
-    def _get_pair_key(self, source: int, target: int) -> str:
-        """Generate a unique key for a channel pair."""
-        return f"{source}:{target}"
+    async def _get_entity(self, chat_id: int) -> Any:
+        """Resolve a channel entity, reusing the one resolved at startup if there is one."""
+        entity = self._entity_cache.get(chat_id)
+        if entity is None:
+            entity = self._entity_cache[chat_id] = await self.client.get_entity(chat_id)
+        return entity
     
     def _get_config_mtime(self) -> float:
         """Get configuration storage modification time."""
@@ -213,21 +405,50 @@ class TelegramForwarder:
         except Exception:
             return 0
     
-    def _load_message_id_map(self) -> Dict[str, Dict[str, int]]:
-        """Load message ID mapping from file."""
+    def _load_message_id_map(self) -> "OrderedDict[Tuple[int, int], Dict[str, Any]]":
+        """
+        Load message ID mapping from file.
+        
+        The file stores one row per mapping:
+        [source_id, source_msg_id, target_id, target_msg_id, timestamp].
+        The older {"source:msg_id": {...}} format is still accepted.
+        """
         if self.message_id_map_file.exists():
             try:
-                with open(self.message_id_map_file, 'r') as f:
-                    return json.load(f)
+                with open(self.message_id_map_file, 'rb') as f:
+                    data = json_io.loads(f.read())
+                if isinstance(data, dict):
+                    rows = []
+                    for key, mapping in data.items():
+                        source, _, source_msg_id = key.rpartition(":")
+                        rows.append([
+                            int(source), int(source_msg_id), mapping.get("target_id"),
+                            mapping.get("target_msg_id"), mapping.get("timestamp", 0)
+                        ])
+                else:
+                    rows = data
+                rows.sort(key=lambda row: row[4] or 0)
+                return OrderedDict(
+                    ((source, source_msg_id), {
+                        "target_id": target_id,
+                        "target_msg_id": target_msg_id,
+                        "timestamp": timestamp
+                    })
+                    for source, source_msg_id, target_id, target_msg_id, timestamp in rows
+                )
             except Exception as e:
                 self.logger.warning(f"Failed to load message ID map: {e}")
-        return {}
+        return OrderedDict()
     
     def _save_message_id_map(self) -> None:
         """Save message ID mapping to file."""
         try:
-            with open(self.message_id_map_file, 'w') as f:
-                json.dump(self.message_id_map, f, indent=2)
+            rows = [
+                [source, source_msg_id, mapping["target_id"], mapping["target_msg_id"], mapping["timestamp"]]
+                for (source, source_msg_id), mapping in self.message_id_map.items()
+            ]
+            with open(self.message_id_map_file, 'wb') as f:
+                f.write(json_io.dumps(rows))
         except Exception as e:
             self.logger.error(f"Failed to save message ID map: {e}")
     
@@ -241,24 +462,114 @@ class TelegramForwarder:
             target: Target channel ID  
             target_msg_id: Target message ID
         """
-        map_key = f"{source}:{source_msg_id}"
+        map_key = (source, source_msg_id)
         self.message_id_map[map_key] = {
             "target_id": target,
             "target_msg_id": target_msg_id,
             "timestamp": time.time()
         }
+        self.message_id_map.move_to_end(map_key)
         
         # Clean up old mappings (keep last 5000, delete oldest 1000)
         if len(self.message_id_map) > 5000:
-            # Sort by timestamp and keep only the newest 4000
-            sorted_items = sorted(
-                self.message_id_map.items(),
-                key=lambda x: x[1].get("timestamp", 0),
-                reverse=True
-            )
-            self.message_id_map = dict(sorted_items[:4000])
+            while len(self.message_id_map) > 4000:
+                self.message_id_map.popitem(last=False)
             self._save_message_id_map()
-            self.logger.debug(f"Cleaned up message ID map, kept 4000 most recent entries")
+            self.logger.debug("Cleaned up message ID map, kept 4000 most recent entries")
+    
+    def _refresh_config_cache(self) -> None:
+        """Rebuild the filter and pair snapshots if the config changed."""
+        version = self.config_manager.version
+        if version == self._config_version:
+            return
+        self._config_version = version
+        # A config edit may be the fix (new target, re-added account); retry everything
+        self._dead_pairs.clear()
+        self._filters = self.config_manager.get_filters()
+        self._channel_pairs = self.config_manager.get_channel_pairs()
+        self.registered_source_channels = {pair["source"] for pair in self._channel_pairs}
+    
+    def _mark_dead_pair(self, source: int, target: int, reason: str) -> None:
+        """Skip copies for a pair that hit a permanent error until the entry expires."""
+        self._dead_pairs[(source, target)] = (reason, time.monotonic() + self.dead_pair_ttl)
+        self._dead_pairs.move_to_end((source, target))
+        if len(self._dead_pairs) > 256:
+            self._dead_pairs.popitem(last=False)
+    
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        """Return the per-chat rate limit bucket, creating it on first use."""
+        bucket = self._per_chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._per_chat_buckets[chat_id] = TokenBucket(self.per_chat_rate_limit, 1.0)
+        return bucket
+    
+    async def _throttle(self, target: int) -> None:
+        """Wait for a send slot to target under the per-chat and global rate limits."""
+        await self._chat_bucket(target).acquire()
+        await self._global_bucket.acquire()
+    
+    def _prepare_caption(self, msg: Message, source: int) -> Tuple[str, Optional[list]]:
+        """
+        Build the outgoing text for a message: replacement rules plus optional source link.
+        
+        Returns:
+            (text, formatting_entities). Entities (including custom emojis) are only
+            kept when the rules left the text unchanged, since edits shift their offsets.
+        """
+        # Use message.message for plain text (not .text which adds markdown)
+        text = msg.message or ""
+        text_was_modified = False
+        
+        # Apply replacement rules
+        if text:
+            processed_text = self.text_processor.process_text(text)
+            if processed_text != text:
+                text = processed_text
+                text_was_modified = True
+        
+        # Add source link if enabled (for testing/verification)
+        # Note: Adding text at the END doesn't break entity offsets at the start
+        if self.add_source_link:
+            text = text + self._source_link_text(source, msg.id)
+        
+        formatting_entities = None if text_was_modified else msg.entities
+        return text, formatting_entities
+    
+    def _source_link_text(self, source: int, msg_id: int) -> str:
+        """Render source_link_text for a message link."""
+        # Convert channel ID to link format (remove -100 prefix), once per channel
+        channel_id = self._link_channel_ids.get(source)
+        if channel_id is None:
+            # -100XXXXXXXXXX -> XXXXXXXXXX; other IDs are left as they are
+            short_id = -source - 10**12 if source <= -10**12 else source
+            channel_id = self._link_channel_ids[source] = str(short_id)
+        message_link = f"https://t.me/c/{channel_id}/{msg_id}"
+        if self._link_parts is None:
+            return self.source_link_text.format(link=message_link)
+        return f"{self._link_parts[0]}{message_link}{self._link_parts[1]}"
+    
+    @staticmethod
+    def _first_sent(sent: Any) -> Optional[Message]:
+        """Return the first message of a send/forward result, which may be a list."""
+        if isinstance(sent, list):
+            return sent[0] if sent else None
+        return sent
+    
+    async def _get_group_messages(self, source: int, message: Message) -> List[Message]:
+        """Return the messages of message's album sorted by ID, reusing a recent fetch."""
+        grouped_id = message.grouped_id
+        group = self._group_cache.get(grouped_id)
+        if group is not None:
+            return group
+        
+        # An album has at most 10 consecutive IDs, so one ids= request covers any member
+        await self._global_bucket.acquire()
+        fetched = await self.client.get_messages(source, ids=list(range(message.id - 9, message.id + 10)))
+        # get_messages(ids=...) answers in request order, so this is already sorted by ID
+        group = [m for m in fetched if m is not None and m.grouped_id == grouped_id]
+        self._group_cache[grouped_id] = group
+        asyncio.get_running_loop().call_later(self._group_cache_ttl, self._group_cache.pop, grouped_id, None)
+        return group
     
     def _is_sticker_or_animated(self, message: Message) -> bool:
         """Check if message contains a sticker or animated sticker."""
@@ -266,11 +577,164 @@ class TelegramForwarder:
             return False
         
         # Check document attributes for sticker or animated
-        if hasattr(message.media, 'document') and hasattr(message.media.document, 'attributes'):
-            for attr in message.media.document.attributes:
-                if isinstance(attr, (DocumentAttributeSticker, DocumentAttributeAnimated)):
-                    return True
-        return False
+        document = getattr(message.media, 'document', None)
+        attributes = getattr(document, 'attributes', None)
+        if attributes is None:
+            return False
+        
+        cached = self._sticker_docs.get(document.id)
+        if cached is not None:
+            return cached
+        result = any(type(attr) in _STICKER_ATTR_TYPES for attr in attributes)
+        self._sticker_docs[document.id] = result
+        if len(self._sticker_docs) > self.max_sticker_docs:
+            self._sticker_docs.popitem(last=False)
+        return result
+    
+    def _get_temp_media_dir(self) -> Path:
+        """Return the temp media directory, creating it on first use."""
+        if not self._temp_media_dir_ready:
+            self.temp_media_dir.mkdir(exist_ok=True)
+            self._temp_media_dir_ready = True
+        return self.temp_media_dir
+    
+    async def _download_media(self, message: Message, in_memory: bool = True) -> Tuple[Any, Optional[str]]:
+        """
+        Download a message's media for re-upload.
+        
+        Args:
+            message: Message whose media to download
+            in_memory: Allow a small file to be kept in memory; False always streams
+                       or uses temp_media
+        
+        Returns:
+            (upload, file_path): what to pass to send_file, and the temp file to clean up
+            afterwards (None for in-memory and streamed uploads). upload is None if
+            nothing was downloaded.
+        """
+        media_file = message.file
+        if (
+            in_memory and media_file is not None and media_file.size is not None
+            and media_file.size <= self.in_memory_media_limit
+        ):
+            # Small enough to keep in memory: no temp file to write, re-read and delete.
+            # The name tells Telethon what kind of file it is on upload
+            upload = io.BytesIO()
+            upload.name = media_file.name or f"media_{message.id}{media_file.ext or ''}"
+            if await self.client.download_media(message, file=upload) is None:
+                return None, None
+            upload.seek(0)
+            return upload, None
+        
+        if self.stream_media_upload and media_file is not None and media_file.size:
+            return await self._stream_upload(message), None
+        
+        # Download media to temp directory
+        file_path = await self.client.download_media(message, file=self._get_temp_media_dir())
+        return file_path, file_path
+    
+    async def _stream_upload(self, message: Message) -> Any:
+        """
+        Upload a message's media to Telegram while it is still downloading.
+        
+        iter_download feeds a bounded queue that upload_file reads from, so the two
+        transfers overlap and memory stays at a few chunks whatever the file size.
+        Returns the uploaded InputFile, ready for send_file.
+        """
+        media_file = message.file
+        name = media_file.name or f"media_{message.id}{media_file.ext or ''}"
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.stream_buffer_chunks)
+        
+        async def pump() -> None:
+            try:
+                async for chunk in self.client.iter_download(
+                    message.media, chunk_size=_STREAM_CHUNK_SIZE, file_size=media_file.size
+                ):
+                    await queue.put(chunk)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+        
+        pump_task = asyncio.create_task(pump())
+        try:
+            # A known file_size lets upload_file read the stream part by part
+            return await self.client.upload_file(
+                _ChunkReader(queue, name), file_size=media_file.size, file_name=name
+            )
+        finally:
+            # Stops a download still blocked on a full queue if the upload failed
+            pump_task.cancel()
+            await asyncio.gather(pump_task, return_exceptions=True)
+    
+    def _schedule_cleanup(self, file_path: str) -> None:
+        """Queue a downloaded media file for deletion by the cleanup worker."""
+        self._cleanup_queue.put_nowait(file_path)
+    
+    def _remove_file(self, file_path: str) -> None:
+        """Delete a single temp file (runs in the executor)."""
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning("Failed to delete %s: %s", file_path, e)
+    
+    def _remove_files(self, file_paths: List[str]) -> None:
+        """Delete a batch of temp files (runs in the executor)."""
+        for file_path in file_paths:
+            self._remove_file(file_path)
+    
+    def _clear_temp_media_dir(self) -> None:
+        """Delete the temp media directory, removing its entries in parallel (runs in a thread)."""
+        try:
+            with os.scandir(self.temp_media_dir) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pool.submit(shutil.rmtree, entry.path, True)
+                else:
+                    pool.submit(self._remove_file, entry.path)
+        # The entries are gone by now, so there's nothing left to walk
+        try:
+            os.rmdir(self.temp_media_dir)
+        except OSError:
+            pass
+    
+    def _sweep_temp_media(self) -> None:
+        """Remove stray temp media files older than the TTL (runs in the executor)."""
+        cutoff = time.time() - self.temp_media_ttl
+        try:
+            with os.scandir(self.temp_media_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        self._remove_file(entry.path)
+        except FileNotFoundError:
+            pass
+    
+    async def _cleanup_worker(self, sweep_interval: int = 300) -> None:
+        """
+        Delete downloaded media files off the event loop.
+        
+        Drains the cleanup queue in batches (one executor job per batch) and
+        periodically sweeps the temp directory for files left behind by
+        crashes or failed sends.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._cleanup_queue
+        while True:
+            try:
+                file_paths = [await asyncio.wait_for(queue.get(), timeout=sweep_interval)]
+            except asyncio.TimeoutError:
+                await loop.run_in_executor(None, self._sweep_temp_media)
+                continue
+            # Albums queue several files at once; take whatever else is already waiting
+            while len(file_paths) < 256 and not queue.empty():
+                file_paths.append(queue.get_nowait())
+            await loop.run_in_executor(None, self._remove_files, file_paths)
     
     # Removed _run_backfill_tasks - no longer needed in polling mode
     
@@ -332,21 +796,36 @@ class TelegramForwarder:
         else:
             self.logger.info(f"Monitoring {len(source_channels)} source channel(s)")
         
-        # Verify access to all channels before starting
+        # Verify access to all channels before starting; resolve each distinct ID once,
+        # concurrently (this also warms Telethon's entity cache for later sends)
+        channel_ids = list({pair["source"] for pair in channel_pairs} | {pair["target"] for pair in channel_pairs})
+        results = await asyncio.gather(
+            *(self.client.get_entity(channel_id) for channel_id in channel_ids),
+            return_exceptions=True
+        )
+        entities = dict(zip(channel_ids, results))
+        self._entity_cache.update(
+            (channel_id, entity) for channel_id, entity in entities.items()
+            if not isinstance(entity, BaseException)
+        )
+        
         for pair in channel_pairs:
-            try:
-                source_entity = await self.client.get_entity(pair["source"])
-                target_entity = await self.client.get_entity(pair["target"])
-                self.logger.info(
-                    f"✓ Access verified: {pair['source']} ({getattr(source_entity, 'title', 'Channel')}) → "
-                    f"{pair['target']} ({getattr(target_entity, 'title', 'Channel')})"
-                )
-            except ValueError as e:
+            source_entity = entities[pair["source"]]
+            target_entity = entities[pair["target"]]
+            for entity in (source_entity, target_entity):
+                if isinstance(entity, BaseException) and not isinstance(entity, ValueError):
+                    raise entity
+            if isinstance(source_entity, ValueError) or isinstance(target_entity, ValueError):
+                e = source_entity if isinstance(source_entity, ValueError) else target_entity
                 self.logger.error(
                     f"✗ Cannot access channels {pair['source']} → {pair['target']}. "
                     f"Make sure your account is a member of both channels. Error: {e}"
                 )
                 continue
+            self.logger.info(
+                f"✓ Access verified: {pair['source']} ({getattr(source_entity, 'title', 'Channel')}) → "
+                f"{pair['target']} ({getattr(target_entity, 'title', 'Channel')})"
+            )
         
         self.logger.info("🔄 POLLING MODE: Checking channels every 5 seconds for new messages")
         self.logger.info(f"📡 Will poll {len(source_channels)} source channel(s)")
@@ -396,19 +875,24 @@ class TelegramForwarder:
             # If backfill_count > 0, backfill now
             if backfill_count > 0:
                 self.logger.info(f"🔄 BACKFILLING {backfill_count} messages: {source} -> {target}")
-                await self.backfill_messages(source, target, backfill_count)
-                
-                # Mark as backfilled
-                self.backfilled_pairs[pair_key] = time.time()
-                self._save_backfill_tracking()
-                self.logger.info(f"✅ Backfill complete for {source} -> {target}")
+                if await self.backfill_messages(source, target, backfill_count):
+                    # Mark as backfilled
+                    self._mark_backfilled(pair_key)
+                    self.logger.info(f"✅ Backfill complete for {source} -> {target}")
+                else:
+                    self.logger.warning(f"⚠️  Backfill incomplete for {source} -> {target}, retrying on next start or reload")
             else:
                 self.logger.info(f"⏭️  SKIPPING - backfill_count is 0 for {source} -> {target}")
         
         # Register message deletion event handler for all source channels
         if source_channels:
             self.logger.info("🗑️  Registering message deletion handler for sync...")
-            @self.client.on(events.MessageDeleted())
+            self._refresh_config_cache()
+            # Filter on plain int chat IDs so events from other chats are dropped in the
+            # dispatcher; the set is rebuilt on config reload, unlike a fixed chats= list
+            @self.client.on(events.MessageDeleted(
+                func=lambda e: e.chat_id in self.registered_source_channels
+            ))
             async def handle_message_deleted(event):
                 await self._handle_deletion(event)
             self.logger.info(f"✅ Deletion handler registered for {len(source_channels)} source channel(s)")
@@ -416,6 +900,13 @@ class TelegramForwarder:
         self.logger.info("Bot is now running. Press Ctrl+C to stop.")
         self.logger.info("🔄 Starting polling loop (checks every 5 seconds)...")
         
+        # Start temp media cleanup worker
+        self._cleanup_task = asyncio.create_task(self._cleanup_worker())
+        
+        # Watch for the admin bot's reload trigger (falls back to polling for the file)
+        if not self._trigger_watcher.start():
+            self.logger.debug("inotify unavailable, polling for %s", self.config_reload_trigger_file)
+        
         # Start polling task
         polling_task = asyncio.create_task(self._poll_channels())
         
@@ -440,13 +931,23 @@ class TelegramForwarder:
         
         while True:
             try:
-                await asyncio.sleep(5)  # Poll every 5 seconds
+                # Poll every 5 seconds, waking early when the reload trigger appears
+                try:
+                    await asyncio.wait_for(self._trigger_watcher.event.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
                 
                 # Check for config reload trigger file OR automatic config change detection
                 should_reload = False
                 reload_reason = ""
                 
-                if self.config_reload_trigger_file.exists():
+                if self._trigger_watcher.active:
+                    triggered = self._trigger_watcher.event.is_set()
+                else:
+                    # Plain os.path on the str path: this runs every cycle without inotify
+                    triggered = os.path.exists(self._trigger_path_str)
+                
+                if triggered:
                     should_reload = True
                     reload_reason = "admin bot trigger"
                 else:
@@ -462,6 +963,14 @@ class TelegramForwarder:
                 
                 if should_reload:
                     self.logger.info(f"🔄 Config reload triggered by {reload_reason}")
+                    # Consume the trigger before reloading: if the reload fails, a
+                    # still-set event would make every wait above return at once
+                    if triggered:
+                        self._trigger_watcher.event.clear()
+                        try:
+                            os.unlink(self._trigger_path_str)
+                        except FileNotFoundError:
+                            pass
                     try:
                         # Reload config
                         self.config = self.config_manager.load()
@@ -469,7 +978,8 @@ class TelegramForwarder:
                         self.logger.info("✅ Config reloaded - new rules/filters active")
                         
                         # Check for NEW channel pairs that need backfilling
-                        channel_pairs = self.config_manager.get_channel_pairs()
+                        self._refresh_config_cache()
+                        channel_pairs = self._channel_pairs
                         for pair in channel_pairs:
                             if not pair.get("enabled", True):
                                 continue
@@ -483,12 +993,14 @@ class TelegramForwarder:
                             if pair_key not in self.backfilled_pairs and backfill_count > 0:
                                 self.logger.info(f"🆕 New pair detected: {source} -> {target}")
                                 self.logger.info(f"🔄 Backfilling {backfill_count} messages...")
-                                await self.backfill_messages(source, target, backfill_count)
-                                
-                                # Mark as backfilled
-                                self.backfilled_pairs[pair_key] = time.time()
-                                self._save_backfill_tracking()
-                                self.logger.info(f"✅ New pair backfilled and ready")
+                                if await self.backfill_messages(source, target, backfill_count):
+                                    # Mark as backfilled
+                                    self._mark_backfilled(pair_key)
+                                    self.logger.info(f"✅ New pair backfilled and ready")
+                                else:
+                                    self.logger.warning(
+                                        f"⚠️  Backfill incomplete for {source} -> {target}, retrying on next start or reload"
+                                    )
                             
                             # Initialize last_processed_ids for new source channels
                             if source not in self.last_processed_ids:
@@ -503,10 +1015,6 @@ class TelegramForwarder:
                                     self.logger.error(f"Cannot access new channel {source}: {e}")
                                     self.last_processed_ids[source] = 0
                         
-                        # Remove trigger file if it exists
-                        if self.config_reload_trigger_file.exists():
-                            self.config_reload_trigger_file.unlink()
-                        
                         self.logger.info("✅ Config reload complete, resuming normal operation")
                         
                     except Exception as e:
@@ -515,20 +1023,21 @@ class TelegramForwarder:
                 # Clear processed groups from previous cycle
                 processed_groups_in_cycle.clear()
                 
-                channel_pairs = self.config_manager.get_channel_pairs()
+                self._refresh_config_cache()
                 
-                for pair in channel_pairs:
-                    if not pair.get("enabled", True):
+                # One fetch per source channel; each new message then goes to all of
+                # that source's targets at once
+                for source in dict.fromkeys(pair["source"] for pair in self._channel_pairs):
+                    targets = self.config_manager.get_targets_for(source)
+                    if not targets:
                         continue
                     
-                    source = pair["source"]
-                    target = pair["target"]
-                    
                     try:
                         # Get last processed message ID
                         last_processed = self.last_processed_ids.get(source, 0)
                         
                         # Fetch messages since last processed (up to 100)
+                        await self._global_bucket.acquire()
                         messages = await self.client.get_messages(
                             source,
                             limit=100,
@@ -554,23 +1063,18 @@ class TelegramForwarder:
                                 # Mark this group as processed
                                 processed_groups_in_cycle.add(message.grouped_id)
                             
-                            # Forward the message
-                            try:
-                                await self.forward_message_with_retry(
-                                    message,
-                                    source,
-                                    target,  # Single target ID, not a list
-                                    is_backfill=False
-                                )
-                                
-                                # Update last processed
+                            # Skip messages already handled (e.g. after last_processed_ids
+                            # failed to save or was rolled back)
+                            if self.forwarded_messages.check_and_add((source, message.id)):
+                                self.logger.debug("Skipping message %s - already handled", message.id)
                                 self.last_processed_ids[source] = message.id
-                                
-                            except Exception as forward_error:
-                                self.logger.error(
-                                    f"Failed to forward message {message.id} from {source} to {target}: {forward_error}"
-                                )
-                                # Continue with next message even if one fails
+                                continue
+                            
+                            received_at = time.time() if self._timing_enabled else 0.0
+                            await self._forward_to_targets(message, source, targets, received_at)
+                            
+                            # Update last processed
+                            self.last_processed_ids[source] = message.id
                         
                         # Save state after processing each channel
                         self._save_last_processed()
@@ -614,23 +1118,19 @@ class TelegramForwarder:
                 self.logger.debug("Deletion event without message IDs, skipping")
                 return
             
-            self.logger.info(f"🗑️  Detected deletion of {len(deleted_ids)} message(s) in {source_channel}")
+            self.logger.info("🗑️  Detected deletion of %s message(s) in %s", len(deleted_ids), source_channel)
             
             # Check if this source channel is in our monitored pairs
-            channel_pairs = self.config_manager.get_channel_pairs()
-            target_channels = []
-            for pair in channel_pairs:
-                if pair["source"] == source_channel and pair.get("enabled", True):
-                    target_channels.append(pair["target"])
+            target_channels = self.config_manager.get_targets_for(source_channel)
             
             if not target_channels:
-                self.logger.debug(f"Source channel {source_channel} not in monitored pairs, ignoring deletion")
+                self.logger.debug("Source channel %s not in monitored pairs, ignoring deletion", source_channel)
                 return
             
             # Delete corresponding messages in target channels
             deletion_count = 0
             for source_msg_id in deleted_ids:
-                map_key = f"{source_channel}:{source_msg_id}"
+                map_key = (source_channel, source_msg_id)
                 
                 if map_key in self.message_id_map:
                     mapping = self.message_id_map[map_key]
@@ -643,8 +1143,8 @@ class TelegramForwarder:
                             await self.client.delete_messages(target_channel, target_msg_id)
                             deletion_count += 1
                             self.logger.info(
-                                f"🗑️  ✅ Deleted message {target_msg_id} in {target_channel} "
-                                f"(source: {source_msg_id} from {source_channel})"
+                                "🗑️  ✅ Deleted message %s in %s (source: %s from %s)",
+                                target_msg_id, target_channel, source_msg_id, source_channel
                             )
                             
                             # Remove from mapping
@@ -658,12 +1158,13 @@ class TelegramForwarder:
                             )
                 else:
                     self.logger.debug(
-                        f"🗑️  Message {source_msg_id} from {source_channel} not found in mapping "
-                        f"(may be older than map retention or never forwarded)"
+                        "🗑️  Message %s from %s not found in mapping "
+                        "(may be older than map retention or never forwarded)",
+                        source_msg_id, source_channel
                     )
             
             if deletion_count > 0:
-                self.logger.info(f"🗑️  Successfully synced {deletion_count}/{len(deleted_ids)} deletion(s)")
+                self.logger.info("🗑️  Successfully synced %s/%s deletion(s)", deletion_count, len(deleted_ids))
         
         except Exception as e:
             self.logger.error(f"Error handling deletion event: {type(e).__name__}: {e}", exc_info=True)
@@ -677,72 +1178,63 @@ class TelegramForwarder:
         """
         try:
             # Track timing for delay analysis
-            import time as time_module
-            start_time = time_module.time()
+            timing = self._timing_enabled
+            start_time = time.time() if timing else 0.0
             
             message = event.message
             source_chat_id = event.chat_id
             
             # DEBUG: Log ALL received messages to verify event handler is working
-            self.logger.info(f"🔔 [DEBUG] Event handler triggered: msg {message.id} from {source_chat_id}")
+            self.logger.info("🔔 [DEBUG] Event handler triggered: msg %s from %s", message.id, source_chat_id)
             
             # Filter: Only process messages from registered source channels
             if source_chat_id not in self.registered_source_channels:
                 # Ignore messages from channels we're not monitoring
-                self.logger.info(f"⏭️  [DEBUG] Skipping message from unmonitored channel: {source_chat_id}")
+                self.logger.info("⏭️  [DEBUG] Skipping message from unmonitored channel: %s", source_chat_id)
                 return
             
             # Track this message for heartbeat monitoring
             self.last_received_msg_ids[source_chat_id] = message.id
             
-            self.logger.info(f"⏱️ [TIMING] Message {message.id} received from {source_chat_id} at {start_time}")
+            # Skip updates we've already handled
+            if self.forwarded_messages.check_and_add((source_chat_id, message.id)):
+                self.logger.debug("Skipping message %s - already handled", message.id)
+                return
+            
+            if timing:
+                self.logger.info("⏱️ [TIMING] Message %s received from %s at %s", message.id, source_chat_id, start_time)
+            
+            # Check filters first - cheapest way to drop a message
+            self._refresh_config_cache()
+            if self._filters.get("enabled", False) and not self.text_processor.should_forward_message(
+                message.message or "", self._filters
+            ):
+                self.logger.debug("Message %s filtered out", message.id)
+                return
             
             # Check if this message is part of a media group we've already processed
             if message.grouped_id:
                 if message.grouped_id in self.processed_groups:
                     self.logger.debug(
-                        f"Skipping message {message.id} - already processed as part of group {message.grouped_id}"
+                        "Skipping message %s - already processed as part of group %s",
+                        message.id, message.grouped_id
                     )
                     return
-                # Mark this group as processed
-                self.processed_groups.add(message.grouped_id)
-                
-                # Clean up old group IDs (keep only last 100)
-                if len(self.processed_groups) > 100:
-                    # Remove oldest entries
-                    sorted_groups = sorted(self.processed_groups)
-                    self.processed_groups = set(sorted_groups[-100:])
+                # Mark this group as processed, evicting the oldest beyond the limit
+                self.processed_groups[message.grouped_id] = None
+                if len(self.processed_groups) > self.max_processed_groups:
+                    self.processed_groups.popitem(last=False)
             
             # Find target channel(s) for this source
-            channel_pairs = self.config_manager.get_channel_pairs()
-            targets = [
-                pair["target"] 
-                for pair in channel_pairs 
-                if pair["source"] == source_chat_id
-            ]
+            targets = self.config_manager.get_targets_for(source_chat_id)
             
             if not targets:
-                self.logger.debug(f"No target channel configured for source {source_chat_id}")
+                self.logger.debug("No target channel configured for source %s", source_chat_id)
                 return
             
-            self.logger.info(f"📨 Processing message {message.id} from {source_chat_id} -> {targets}")
+            self.logger.info("📨 Processing message %s from %s -> %s", message.id, source_chat_id, targets)
             
-            # Get message text (from message or caption)
-            text = message.text or message.message or ""
-            
-            # Check filters
-            filters = self.config_manager.get_filters()
-            if not self.text_processor.should_forward_message(text, filters):
-                self.logger.debug(f"Message {message.id} filtered out")
-                return
-            
-            # Forward to all target channels
-            for target in targets:
-                forward_start = time_module.time()
-                await self.forward_message_with_retry(message, source_chat_id, target)
-                forward_end = time_module.time()
-                forward_duration = forward_end - start_time
-                self.logger.info(f"⏱️ [TIMING] Message {message.id} forwarded in {forward_duration:.2f}s (processing time: {forward_end - forward_start:.2f}s)")
+            await self._forward_to_targets(message, source_chat_id, targets, start_time)
         
         except Exception as e:
             self.logger.error(
@@ -751,12 +1243,167 @@ class TelegramForwarder:
                 exc_info=True
             )
     
+    async def _forward_to_targets(
+        self, message: Message, source: int, targets: Tuple[int, ...], received_at: float = 0.0
+    ) -> None:
+        """
+        Send a new message to every target of its source.
+        
+        Targets are sent to concurrently, so a slow or rate-limited target doesn't hold
+        up the others. Media is uploaded once: the first target's send stores the upload
+        in a shared media_cache and the remaining targets resend it by reference.
+        """
+        media_cache: Optional[Dict[str, Any]] = {} if len(targets) > 1 else None
+        remaining = targets
+        if media_cache is not None and message.media:
+            await self._forward_live(message, source, targets[0], media_cache, received_at)
+            remaining = targets[1:]
+        await asyncio.gather(
+            *(self._forward_live(message, source, target, media_cache, received_at) for target in remaining)
+        )
+    
+    async def _forward_live(
+        self,
+        message: Message,
+        source: int,
+        target: int,
+        media_cache: Optional[Dict[str, Any]],
+        received_at: float
+    ) -> None:
+        """Send a new message to one target, logging (not raising) failures."""
+        try:
+            timing = self._timing_enabled and received_at
+            forward_start = time.time() if timing else 0.0
+            await self.forward_message_with_retry(message, source, target, media_cache=media_cache)
+            if timing:
+                forward_end = time.time()
+                self.logger.info(
+                    "⏱️ [TIMING] Message %s forwarded in %.2fs (processing time: %.2fs)",
+                    message.id, forward_end - received_at, forward_end - forward_start
+                )
+        except Exception as e:
+            self.logger.error(
+                f"❌ Failed to send message {message.id} from {source} to {target}: {type(e).__name__}: {e}"
+            )
+    
+    async def _send_text(
+        self,
+        message: Message,
+        target: int,
+        text: str,
+        formatting_entities: Optional[list],
+        reply_to: Optional[int],
+        media_cache: Optional[Dict[str, Any]]
+    ) -> Optional[Message]:
+        """Send a text-only message."""
+        await self._throttle(target)
+        return await self.client.send_message(
+            target, 
+            text,
+            reply_to=reply_to,
+            formatting_entities=formatting_entities
+        )
+    
+    async def _send_document(
+        self,
+        message: Message,
+        target: int,
+        text: str,
+        formatting_entities: Optional[list],
+        reply_to: Optional[int],
+        media_cache: Optional[Dict[str, Any]]
+    ) -> Optional[Message]:
+        """Send a document; stickers go out directly, everything else keeps its attributes."""
+        # Check if it's a sticker or animated sticker - send directly without downloading
+        if self._is_sticker_or_animated(message):
+            self.logger.debug("Detected sticker/animated emoji, sending directly without download")
+            await self._throttle(target)
+            return await self.client.send_file(
+                target,
+                message.media,
+                caption=text if text else None,
+                reply_to=reply_to,
+                formatting_entities=formatting_entities
+            )
+        
+        # This is a document (video, gif, etc.) - preserve attributes on re-upload
+        document = message.media.document
+        return await self._send_media(
+            message, target, text, formatting_entities, reply_to, media_cache,
+            attributes=document.attributes if document else None
+        )
+    
+    async def _send_media(
+        self,
+        message: Message,
+        target: int,
+        text: str,
+        formatting_entities: Optional[list],
+        reply_to: Optional[int],
+        media_cache: Optional[Dict[str, Any]],
+        attributes: Optional[list] = None
+    ) -> Optional[Message]:
+        """Send any other media, reusing an earlier upload or downloading and re-uploading it."""
+        # Media already uploaded for another target: resend it by reference
+        uploaded_media = media_cache.get("media") if media_cache is not None else None
+        if uploaded_media:
+            await self._throttle(target)
+            return await self.client.send_file(
+                target,
+                uploaded_media,
+                caption=text if text else None,
+                reply_to=reply_to,
+                formatting_entities=formatting_entities
+            )
+        
+        # Download and re-upload
+        file_path = None
+        try:
+            upload, file_path = await self._download_media(message)
+            if not upload:
+                raise Exception("Download returned None")
+            
+            # Re-upload with processed caption
+            await self._throttle(target)
+            sent_msg = await self.client.send_file(
+                target,
+                upload,
+                caption=text if text else None,
+                reply_to=reply_to,
+                formatting_entities=formatting_entities,
+                attributes=attributes,
+                force_document=False
+            )
+            if sent_msg and media_cache is not None:
+                media_cache["media"] = sent_msg.media
+            return sent_msg
+        
+        except Exception as download_error:
+            # If download fails, try direct send with original media
+            self.logger.warning("Download failed, trying direct send: %s", download_error)
+            # Use send_file for better media handling instead of send_message
+            await self._throttle(target)
+            return await self.client.send_file(
+                target,
+                message.media,
+                caption=text if text else None,
+                reply_to=reply_to,
+                formatting_entities=formatting_entities,
+                force_document=False
+            )
+        finally:
+            # Ensure cleanup even if send fails
+            if file_path:
+                self._schedule_cleanup(file_path)
+    
     async def forward_message_with_retry(
         self, 
         message: Message, 
         source: int, 
         target: int,
-        is_backfill: bool = False
+        is_backfill: bool = False,
+        media_cache: Optional[Dict[str, Any]] = None,
+        group: Optional[List[Message]] = None
     ) -> bool:
         """
         Copy and send a message without "Forwarded from" metadata.
@@ -766,69 +1413,68 @@ class TelegramForwarder:
             source: Source channel ID
             target: Target channel ID
             is_backfill: Whether this is a backfill operation
+            media_cache: Shared dict when the same message is sent to several targets.
+                         The first upload stores the resulting media here and later
+                         targets resend it by reference instead of downloading again.
+            group: Members of message's album in ID order, when the caller already has
+                   them (backfill); otherwise they are fetched
             
         Returns:
             True if successful, False otherwise
         """
+        # Pairs that just failed with a permanent error are skipped without a request
+        dead = self._dead_pairs.get((source, target))
+        if dead is not None:
+            if dead[1] > time.monotonic():
+                self.logger.debug("Skipping message %s for %s -> %s: %s", message.id, source, target, dead[0])
+                return False
+            del self._dead_pairs[(source, target)]
+        
         attempt = 0
         prefix = "BACKFILL" if is_backfill else "LIVE"
         
+        # Caption/text and the reply target don't change between attempts; resolve them once.
+        # A bad source_link_text template (stray brace, unknown field) fails here for
+        # every message, so report it like any other failed copy instead of raising
+        try:
+            text, formatting_entities = self._prepare_caption(message, source)
+        except Exception as e:
+            self.logger.error(f"❌ [{prefix}] Failed to prepare text for message {message.id}: {type(e).__name__}: {e}")
+            return False
+        
+        # Get reply_to_msg_id if this is a reply
+        reply_to = None
+        if message.reply_to and message.reply_to.reply_to_msg_id:
+            # Map the source reply ID to target reply ID
+            source_reply_id = message.reply_to.reply_to_msg_id
+            mapping = self.message_id_map.get((source, source_reply_id))
+            if mapping:
+                reply_to = mapping.get("target_msg_id")
+            if not reply_to:
+                self.logger.debug(
+                    "Reply target message %s not found in map, reply chain will break",
+                    source_reply_id
+                )
+        
+        # Forwarding with drop_author=True is a server-side copy; it only fits when we
+        # send the text as is (no rules applied, no source link) and there's no reply
+        # to remap. Forwarded messages have their own branch below
+        copy_server_side = (
+            self.server_side_copy
+            and reply_to is None
+            and not message.forward
+            and text == (message.message or "")
+        )
+        
         while attempt < self.retry_attempts:
             try:
-                # Get message text/caption - use message.message for plain text (not .text which adds markdown)
-                original_text = message.message or ""
-                text = original_text
-                
-                # Track if text was modified (modifications break entity offsets)
-                text_was_modified = False
-                
-                # Apply replacement rules
-                if text:
-                    processed_text = self.text_processor.process_text(text)
-                    if processed_text != text:
-                        text = processed_text
-                        text_was_modified = True
-                
-                # Add source link if enabled (for testing/verification)
-                # Note: Adding text at the END doesn't break entity offsets at the start
-                if self.add_source_link:
-                    # Convert channel ID to link format (remove -100 prefix)
-                    channel_id = str(source).replace("-100", "")
-                    message_link = f"https://t.me/c/{channel_id}/{message.id}"
-                    link_text = self.source_link_text.format(link=message_link)
-                    text = (text or "") + link_text
-                    # Don't set text_was_modified here since we only append at the end
-                
-                # Get reply_to_msg_id if this is a reply
-                reply_to = None
-                if message.reply_to and message.reply_to.reply_to_msg_id:
-                    # Map the source reply ID to target reply ID
-                    source_reply_id = message.reply_to.reply_to_msg_id
-                    map_key = f"{source}:{source_reply_id}"
-                    mapping = self.message_id_map.get(map_key)
-                    if mapping:
-                        reply_to = mapping.get("target_msg_id")
-                    if not reply_to:
-                        self.logger.debug(
-                            f"Reply target message {source_reply_id} not found in map, reply chain will break"
-                        )
-                
                 # Check if message is forwarded from another channel
                 if message.forward:
                     # This message was forwarded from somewhere, so forward it to target
                     # Try to forward from the ORIGINAL source to preserve "Forwarded from" metadata
                     try:
-                        # Debug: Log forward object attributes (using INFO to ensure visibility)
-                        self.logger.info(f"🔍 DEBUG - Forward object type: {type(message.forward)}")
-                        self.logger.info(f"🔍 DEBUG - Forward attributes: {[attr for attr in dir(message.forward) if not attr.startswith('_')]}")
-                        self.logger.info(
-                            f"🔍 DEBUG - from_id: {getattr(message.forward, 'from_id', 'NOT FOUND')}, "
-                            f"from_name: {getattr(message.forward, 'from_name', 'NOT FOUND')}, "
-                            f"channel_post: {getattr(message.forward, 'channel_post', 'NOT FOUND')}, "
-                            f"chat_id: {getattr(message.forward, 'chat_id', 'NOT FOUND')}, "
-                            f"saved_from_peer: {getattr(message.forward, 'saved_from_peer', 'NOT FOUND')}, "
-                            f"saved_from_msg_id: {getattr(message.forward, 'saved_from_msg_id', 'NOT FOUND')}"
-                        )
+                        # Debug: Log forward object attributes (only rendered if DEBUG is emitted)
+                        self.logger.debug("🔍 DEBUG - Forward object: %s", _LazyForwardRepr(message.forward))
                         
                         # Check if we have the original channel and message ID
                         original_channel = None
@@ -843,8 +1489,8 @@ class TelegramForwarder:
                             original_msg_id = message.forward.channel_post
                         
                         self.logger.info(
-                            f"🔍 Detected forwarded message - Original channel: {original_channel}, "
-                            f"Original message: {original_msg_id}"
+                            "🔍 Detected forwarded message - Original channel: %s, Original message: %s",
+                            original_channel, original_msg_id
                         )
                         
                         sent_msg = None
@@ -853,40 +1499,48 @@ class TelegramForwarder:
                         if original_channel and original_msg_id:
                             try:
                                 self.logger.info(
-                                    f"🔄 Attempting to forward from ORIGINAL channel {original_channel}, "
-                                    f"message {original_msg_id} to target {target}"
+                                    "🔄 Attempting to forward from ORIGINAL channel %s, message %s to target %s",
+                                    original_channel, original_msg_id, target
                                 )
-                                sent_msg = await self.client.forward_messages(
+                                await self._throttle(target)
+                                sent_msg = self._first_sent(await self.client.forward_messages(
                                     target, 
                                     original_msg_id, 
                                     original_channel
-                                )
+                                ))
                                 self.logger.info(
-                                    f"✅ {prefix} -> Successfully forwarded from ORIGINAL channel "
-                                    f"{original_channel} (msg {original_msg_id}) to {target}"
+                                    "✅ %s -> Successfully forwarded from ORIGINAL channel %s (msg %s) to %s",
+                                    prefix, original_channel, original_msg_id, target
                                 )
+                            except (FloodWaitError, SlowModeWaitError):
+                                # Rate limits are handled by the retry loop, not by falling back
+                                raise
                             except Exception as original_forward_error:
                                 self.logger.warning(
-                                    f"❌ Could not forward from ORIGINAL channel {original_channel}: "
-                                    f"{type(original_forward_error).__name__}: {original_forward_error}"
+                                    "❌ Could not forward from ORIGINAL channel %s: %s: %s",
+                                    original_channel, type(original_forward_error).__name__, original_forward_error
                                 )
-                                self.logger.info(f"🔄 Trying fallback: forwarding from source channel...")
+                                self.logger.info("🔄 Trying fallback: forwarding from source channel...")
                                 # Fall through to try forwarding from source channel
                         
                         # If forwarding from original failed, try from source channel
                         if not sent_msg:
                             try:
-                                self.logger.info(f"🔄 Trying to forward from SOURCE channel {source}...")
-                                sent_msg = await self.client.forward_messages(target, message)
+                                self.logger.info("🔄 Trying to forward from SOURCE channel %s...", source)
+                                await self._throttle(target)
+                                sent_msg = self._first_sent(await self.client.forward_messages(target, message))
                                 self.logger.info(
-                                    f"✅ {prefix} -> Forwarded message {message.id} from SOURCE {source} to {target}"
+                                    "✅ %s -> Forwarded message %s from SOURCE %s to %s",
+                                    prefix, message.id, source, target
                                 )
+                            except (FloodWaitError, SlowModeWaitError):
+                                raise
                             except Exception as source_forward_error:
                                 self.logger.warning(
-                                    f"❌ Could not forward from SOURCE channel either: "
-                                    f"{type(source_forward_error).__name__}: {source_forward_error}"
+                                    "❌ Could not forward from SOURCE channel either: %s: %s",
+                                    type(source_forward_error).__name__, source_forward_error
                                 )
-                                self.logger.info(f"📋 Final fallback: Will copy message content instead")
+                                self.logger.info("📋 Final fallback: Will copy message content instead")
                                 # Fall through to copying method
                         
                         # Store message ID mapping for reply chains and deletion sync
@@ -894,8 +1548,8 @@ class TelegramForwarder:
                             self._store_message_mapping(source, message.id, target, sent_msg.id)
                             return True
                         
-                    except Exception as forward_error:
-                        self.logger.warning(f"Forward handling failed: {forward_error}, will copy instead")
+                    except (ChannelPrivateError, MessageIdInvalidError, ChatForwardsRestrictedError) as forward_error:
+                        self.logger.warning("Forward handling failed: %s, will copy instead", forward_error)
                         # Fall through to copying method
                 
                 # Handle media groups (albums with multiple photos/videos)
@@ -904,244 +1558,183 @@ class TelegramForwarder:
                     # Get all messages in this group
                     media_files = []
                     try:
-                        messages_in_group = await self.client.get_messages(
-                            source,
-                            limit=10,
-                            min_id=message.id - 10,
-                            max_id=message.id + 10
-                        )
+                        # Kept for later attempts; the group cache may have expired by then
+                        if not group:
+                            group = await self._get_group_messages(source, message)
+                        sorted_group = group
                         
-                        # Filter messages with same grouped_id
-                        group_messages = [
-                            m for m in messages_in_group
-                            if m.grouped_id == message.grouped_id
-                        ]
+                        # Caption could be on any photo, not necessarily the first one;
+                        # the link uses the captioned message, otherwise the first one
+                        caption_msg = next((msg for msg in sorted_group if msg.message), None)
+                        if caption_msg is None and sorted_group:
+                            caption_msg = sorted_group[0]
+                        if caption_msg is not None and caption_msg.id == message.id:
+                            # Already prepared for this message above
+                            group_text, group_entities = text, formatting_entities
+                        elif caption_msg is not None:
+                            group_text, group_entities = self._prepare_caption(caption_msg, source)
+                        else:
+                            group_text, group_entities = "", None
                         
-                        # Sort by ID to get correct order
-                        sorted_group = sorted(group_messages, key=lambda x: x.id)
+                        # Reuse media already uploaded for another target of this message
+                        uploaded_media = media_cache.get("group") if media_cache is not None else None
                         
-                        # Extract caption from ANY message in group that has text
-                        # (caption could be on any photo, not necessarily the first one)
-                        group_text = ""
-                        caption_msg = None
-                        group_text_was_modified = False
+                        sent_msg = None
+                        group_files = uploaded_media
+                        if not group_files:
+                            # Send the album by reference first: Telegram already has the files,
+                            # so nothing is downloaded or re-uploaded
+                            media_refs = [msg.media for msg in sorted_group if msg.media]
+                            if media_refs:
+                                try:
+                                    await self._throttle(target)
+                                    sent_msg = await self.client.send_file(
+                                        target,
+                                        media_refs,
+                                        caption=group_text if group_text else None,
+                                        reply_to=reply_to,
+                                        formatting_entities=group_entities,
+                                        force_document=False
+                                    )
+                                    group_files = media_refs
+                                except (FloodWaitError, SlowModeWaitError):
+                                    # Rate limits go to the retry loop; downloading wouldn't help
+                                    raise
+                                except RPCError as ref_error:
+                                    # Expired references, restricted or invalid media and the
+                                    # like: the files may still go through as a fresh upload
+                                    self.logger.debug("Album resend by reference failed (%s), downloading instead", ref_error)
                         
-                        if sorted_group:
-                            # Try to find a message with text/caption
-                            for msg in sorted_group:
-                                msg_text = msg.message or ""  # Use .message not .text to avoid markdown
-                                if msg_text:
-                                    group_text = msg_text
-                                    caption_msg = msg
-                                    break
+                        # Fallback: download all media in the group, a few files at a time
+                        if not group_files:
+                            download_slots = asyncio.Semaphore(4)
                             
-                            # If we found a caption, process it
-                            if group_text:
-                                processed_group_text = self.text_processor.process_text(group_text)
-                                if processed_group_text != group_text:
-                                    group_text = processed_group_text
-                                    group_text_was_modified = True
+                            async def download(msg: Message, in_memory: bool) -> Tuple[Any, Optional[str]]:
+                                async with download_slots:
+                                    return await self._download_media(msg, in_memory)
                             
-                            # Add source link (use first message ID for link)
-                            if self.add_source_link:
-                                channel_id = str(source).replace("-100", "")
-                                # Use the message with caption if found, otherwise first message
-                                link_msg = caption_msg if caption_msg else sorted_group[0]
-                                message_link = f"https://t.me/c/{channel_id}/{link_msg.id}"
-                                link_text = self.source_link_text.format(link=message_link)
-                                group_text = (group_text or "") + link_text
-                        
-                        # Download all media in the group
-                        for msg in sorted_group:
-                            if msg.media:
-                                # Download to temp directory
-                                file_path = await self.client.download_media(
-                                    msg,
-                                    file=self.temp_media_dir
-                                )
-                                if file_path:
-                                    media_files.append(file_path)
-                        
-                        # Send all media together with caption from first message
-                        if media_files:
-                            # Preserve entities (including custom emojis) ONLY if text wasn't modified
-                            formatting_entities = None
-                            if not group_text_was_modified and caption_msg and hasattr(caption_msg, 'entities'):
-                                formatting_entities = caption_msg.entities
+                            # Every member is held until the album is sent, so only the first
+                            # album_memory_limit bytes stay in memory; the rest is streamed
+                            # or goes through temp_media
+                            memory_budget = self.album_memory_limit
+                            plan = []
+                            for msg in sorted_group:
+                                if not msg.media:
+                                    continue
+                                size = msg.file.size if msg.file is not None else None
+                                in_memory = size is not None and size <= memory_budget
+                                if in_memory:
+                                    memory_budget -= size
+                                plan.append((msg, in_memory))
                             
-                            # For media groups, Telethon will auto-detect video/photo types
-                            # But we can pass force_document=False to ensure proper handling
-                            sent_msg = await self.client.send_file(
-                                target,
-                                media_files,
-                                caption=group_text if group_text else None,
-                                reply_to=reply_to,
-                                formatting_entities=formatting_entities,
-                                force_document=False
+                            # gather keeps album order
+                            downloaded = await asyncio.gather(
+                                *(download(msg, in_memory) for msg, in_memory in plan),
+                                return_exceptions=True
                             )
+                            results = [result for result in downloaded if isinstance(result, tuple)]
+                            media_files.extend(file_path for _, file_path in results if file_path)
+                            errors = [err for err in downloaded if isinstance(err, BaseException)]
+                            if errors:
+                                raise errors[0]
+                            group_files = [upload for upload, _ in results if upload]
+                        
+                        # Send all media together with caption from first message
+                        if group_files:
+                            if sent_msg is None:
+                                # For media groups, Telethon will auto-detect video/photo types
+                                # But we can pass force_document=False to ensure proper handling
+                                await self._throttle(target)
+                                sent_msg = await self.client.send_file(
+                                    target,
+                                    group_files,
+                                    caption=group_text if group_text else None,
+                                    reply_to=reply_to,
+                                    formatting_entities=group_entities,
+                                    force_document=False
+                                )
                             
                             # Store message ID mapping for reply chains and deletion sync
                             if sent_msg:
                                 # For media groups, sent_msg might be a list
-                                if isinstance(sent_msg, list):
-                                    # Map the first message in group (which has the caption)
-                                    self._store_message_mapping(source, message.id, target, sent_msg[0].id)
-                                else:
-                                    self._store_message_mapping(source, message.id, target, sent_msg.id)
+                                sent_list = sent_msg if isinstance(sent_msg, list) else [sent_msg]
+                                # Map the first message in group (which has the caption)
+                                self._store_message_mapping(source, message.id, target, sent_list[0].id)
+                                if media_cache is not None and not uploaded_media:
+                                    media_cache["group"] = [m.media for m in sent_list]
                             
                             self.logger.info(
-                                f"{prefix} -> Sent media group with {len(media_files)} items "
-                                f"from {source} to {target}"
+                                "%s -> Sent media group with %d items from %s to %s",
+                                prefix, len(group_files), source, target
                             )
                             
                             # Clean up downloaded files
                             for file_path in media_files:
-                                try:
-                                    os.remove(file_path)
-                                except Exception as e:
-                                    self.logger.warning(f"Failed to delete {file_path}: {e}")
+                                self._schedule_cleanup(file_path)
                             
                             return True
                     except Exception as group_error:
-                        self.logger.warning(f"Media group handling failed: {group_error}, trying single message")
+                        self.logger.warning("Media group handling failed: %s, trying single message", group_error)
                         # Clean up any downloaded files
                         for file_path in media_files:
-                            try:
-                                os.remove(file_path)
-                            except:
-                                pass
+                            self._schedule_cleanup(file_path)
                         # Fall through to single message handling
                 
-                # Handle single media message
-                if message.media:
-                    # Check if it's a sticker or animated sticker - send directly without downloading
-                    if self._is_sticker_or_animated(message):
-                        self.logger.debug(f"Detected sticker/animated emoji, sending directly without download")
-                        # Preserve entities ONLY if text wasn't modified
-                        formatting_entities = None
-                        if not text_was_modified and hasattr(message, 'entities'):
-                            formatting_entities = message.entities
-                        
-                        sent_msg = await self.client.send_file(
-                            target,
-                            message.media,
-                            caption=text if text else None,
-                            reply_to=reply_to,
-                            formatting_entities=formatting_entities
+                # Unchanged content that isn't a reply can be copied server-side: forwarding
+                # without the author needs no download or re-upload
+                if copy_server_side:
+                    try:
+                        await self._throttle(target)
+                        sent_msg = self._first_sent(
+                            await self.client.forward_messages(target, message, drop_author=True)
                         )
-                        
-                        # Store message ID mapping for reply chains and deletion sync
+                    except (FloodWaitError, SlowModeWaitError):
+                        raise
+                    except Exception as copy_error:
+                        # e.g. the source restricts forwarding; copy the content ourselves
+                        self.logger.debug("Server-side copy of %s failed (%s), copying instead", message.id, copy_error)
+                        copy_server_side = False
+                    else:
                         if sent_msg:
                             self._store_message_mapping(source, message.id, target, sent_msg.id)
-                        
-                        self.logger.info(f"{prefix} -> Sent sticker/emoji {message.id} from {source} to {target}")
-                        return True
-                    
-                    # For non-stickers, download and re-upload
-                    file_path = None
-                    try:
-                        # Download media to temp directory
-                        file_path = await self.client.download_media(
-                            message,
-                            file=self.temp_media_dir
-                        )
-                        
-                        if file_path:
-                            # Re-upload with processed caption
-                            # Preserve entities (including custom emojis) ONLY if text wasn't modified
-                            formatting_entities = None
-                            if not text_was_modified and hasattr(message, 'entities'):
-                                formatting_entities = message.entities
-                            
-                            # Extract media attributes from original message to preserve video/photo properties
-                            attributes = None
-                            force_document = False
-                            if hasattr(message.media, 'document') and message.media.document:
-                                # This is a document (video, gif, etc.) - preserve attributes
-                                attributes = message.media.document.attributes
-                            
-                            sent_msg = await self.client.send_file(
-                                target,
-                                file_path,
-                                caption=text if text else None,
-                                reply_to=reply_to,
-                                formatting_entities=formatting_entities,
-                                attributes=attributes,
-                                force_document=force_document
-                            )
-                            
-                            # Store message ID mapping for reply chains and deletion sync
-                            if sent_msg:
-                                self._store_message_mapping(source, message.id, target, sent_msg.id)
-                            
-                            # Clean up downloaded file
-                            try:
-                                os.remove(file_path)
-                            except Exception as e:
-                                self.logger.warning(f"Failed to delete {file_path}: {e}")
-                        else:
-                            raise Exception("Download returned None")
-                    
-                    except Exception as download_error:
-                        # If download fails, try direct send with original media
-                        self.logger.warning(f"Download failed, trying direct send: {download_error}")
-                        # Preserve entities ONLY if text wasn't modified
-                        formatting_entities = None
-                        if not text_was_modified and hasattr(message, 'entities'):
-                            formatting_entities = message.entities
-                        
-                        # Use send_file for better media handling instead of send_message
-                        await self.client.send_file(
-                            target,
-                            message.media,
-                            caption=text if text else None,
-                            reply_to=reply_to,
-                            formatting_entities=formatting_entities,
-                            force_document=False
-                        )
-                    finally:
-                        # Ensure cleanup even if send fails
-                        if file_path and os.path.exists(file_path):
-                            try:
-                                os.remove(file_path)
-                            except:
-                                pass
-                else:
-                    # Send text-only message
-                    # Preserve entities (including custom emojis) ONLY if text wasn't modified
-                    formatting_entities = None
-                    if not text_was_modified and hasattr(message, 'entities'):
-                        formatting_entities = message.entities
-                    
-                    sent_msg = await self.client.send_message(
-                        target, 
-                        text,
-                        reply_to=reply_to,
-                        formatting_entities=formatting_entities
-                    )
-                    
-                    # Store message ID mapping for reply chains and deletion sync
-                    if sent_msg:
-                        self._store_message_mapping(source, message.id, target, sent_msg.id)
+                            self.logger.info("%s -> Copied message %s from %s to %s", prefix, message.id, source, target)
+                            return True
+                        copy_server_side = False
                 
-                self.logger.info(
-                    f"{prefix} -> Copied message {message.id} "
-                    f"from {source} to {target}"
-                )
+                # Single message: one lookup on the media type picks the send path
+                handler = self._media_dispatch.get(type(message.media), self._send_media)
+                sent_msg = await handler(message, target, text, formatting_entities, reply_to, media_cache)
+                
+                # Store message ID mapping for reply chains and deletion sync
+                if sent_msg:
+                    self._store_message_mapping(source, message.id, target, sent_msg.id)
+                
+                self.logger.info("%s -> Copied message %s from %s to %s", prefix, message.id, source, target)
                 return True
                 
             except FloodWaitError as e:
+                if e.seconds > self.max_flood_wait:
+                    self.logger.error(
+                        "FloodWaitError: asked to wait %s seconds (limit %s), giving up on message %s",
+                        e.seconds, self.max_flood_wait, message.id
+                    )
+                    return False
                 wait_time = e.seconds + self.flood_wait_extra
+                # Other live and backfill sends to this chat wait the limit out once in
+                # _throttle instead of each running into it and sleeping on their own
+                self._chat_bucket(target).penalize(wait_time)
                 self.logger.warning(
-                    f"FloodWaitError: Waiting {wait_time} seconds before retry"
+                    "FloodWaitError: Waiting %s seconds before retry", wait_time
                 )
                 await asyncio.sleep(wait_time)
                 attempt += 1
                 
             except SlowModeWaitError as e:
                 wait_time = e.seconds + 1
+                # Hold back every other send to this chat for the same period
+                self._chat_bucket(target).penalize(wait_time)
                 self.logger.warning(
-                    f"SlowModeWaitError: Waiting {wait_time} seconds before retry"
+                    "SlowModeWaitError: Waiting %s seconds before retry", wait_time
                 )
                 await asyncio.sleep(wait_time)
                 attempt += 1
@@ -1156,12 +1749,14 @@ class TelegramForwarder:
                 self.logger.error(
                     f"Cannot access channel {target} - it's private or you're not a member"
                 )
+                self._mark_dead_pair(source, target, "channel is private")
                 return False
                 
             except ChatWriteForbiddenError:
                 self.logger.error(
                     f"Cannot write to channel {target} - insufficient permissions"
                 )
+                self._mark_dead_pair(source, target, "no write permission")
                 return False
                 
             except ChatForwardsRestrictedError:
@@ -1169,6 +1764,7 @@ class TelegramForwarder:
                     f"Cannot copy messages from {source} - channel has forwarding restrictions enabled. "
                     f"The admin must disable 'Restrict saving content' in channel settings."
                 )
+                self._mark_dead_pair(source, target, "forwarding restricted")
                 return False
                 
             except Exception as e:
@@ -1178,8 +1774,9 @@ class TelegramForwarder:
                 )
                 
                 if attempt < self.retry_attempts - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    self.logger.info(f"Retrying in {delay} seconds...")
+                    # Capped exponential backoff, jittered so concurrent senders spread out
+                    delay = min(self.max_backoff, self.retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                    self.logger.info("Retrying in %.1f seconds...", delay)
                     await asyncio.sleep(delay)
                     attempt += 1
                 else:
@@ -1190,12 +1787,33 @@ class TelegramForwarder:
         )
         return False
     
+    async def _with_flood_retry(self, func, *args, max_attempts: int = 8, **kwargs):
+        """
+        Await func(*args, **kwargs), sleeping out FloodWait errors.
+        
+        The wait gets up to a second of jitter so workers that were limited
+        together don't all retry at the same moment.
+        """
+        for attempt in range(1, max_attempts + 1):
+            try:
+                await self._global_bucket.acquire()
+                return await func(*args, **kwargs)
+            except FloodWaitError as e:
+                if attempt == max_attempts:
+                    raise
+                wait_time = e.seconds + random.uniform(0, 1)
+                self.logger.warning(
+                    "FloodWaitError while fetching: waiting %.1f seconds (attempt %s/%s)",
+                    wait_time, attempt, max_attempts
+                )
+                await asyncio.sleep(wait_time)
+    
     async def backfill_messages(
         self, 
         source: int, 
         target: int, 
         count: int
-    ) -> None:
+    ) -> bool:
         """
         Backfill recent messages from source to target (copies without "Forwarded from").
         
@@ -1203,61 +1821,247 @@ class TelegramForwarder:
             source: Source channel ID
             target: Target channel ID
             count: Number of recent messages to backfill
+            
+        Returns:
+            True if every message was copied, False if the backfill failed or any
+            message couldn't be copied (the checkpoint then stops before it)
         """
         if count <= 0:
-            return
+            return True
         
         try:
             self.logger.info(
                 f"Backfilling last {count} messages from {source} to {target}"
             )
             
-            # Get channel entities first (important for Telethon)
+            # Get channel entities first (important for Telethon); start() has usually
+            # resolved them already
             try:
-                source_entity = await self.client.get_entity(source)
-                target_entity = await self.client.get_entity(target)
+                source_entity = await self._get_entity(source)
+                await self._get_entity(target)
             except ValueError as e:
                 self.logger.error(
                     f"Cannot access channel - make sure your account is a member of both channels. "
                     f"Source: {source}, Target: {target}. Error: {e}"
                 )
-                return
+                return False
             
-            # Get recent messages
-            messages = await self.client.get_messages(source_entity, limit=count)
+            pair_key = self._get_pair_key(source, target)
+            checkpoint = self.backfill_progress.get(pair_key)
+            if checkpoint and checkpoint["max_id"] is not None:
+                # Resume an interrupted backfill inside its original window; messages
+                # newer than that have been forwarded live since
+                min_id, max_id = checkpoint["after"], checkpoint["max_id"]
+                self.logger.info("Resuming backfill %s -> %s after message %s", source, target, min_id)
+            else:
+                # Bound the window of the last `count` messages so it can be streamed
+                # oldest-first (reverse iteration alone starts at the channel's beginning)
+                newest = await self._with_flood_retry(self.client.get_messages, source_entity, limit=1)
+                if not newest:
+                    self.logger.info(f"No messages to backfill in {source}")
+                    return True
+                oldest = await self._with_flood_retry(
+                    self.client.get_messages, source_entity, limit=1, add_offset=count - 1
+                )
+                min_id = oldest[0].id - 1 if oldest else 0
+                max_id = newest[0].id + 1
+                if checkpoint and checkpoint["after"] > min_id:
+                    min_id = checkpoint["after"]
+                    self.logger.info("Resuming backfill %s -> %s after message %s", source, target, min_id)
+                checkpoint = {
+                    "after": min_id,
+                    "grouped_id": checkpoint["grouped_id"] if checkpoint else None,
+                    "max_id": max_id,
+                    "failed": checkpoint["failed"] if checkpoint else {}
+                }
+                self.backfill_progress[pair_key] = checkpoint
+                self._save_backfill_progress()
+            resume_grouped_id = checkpoint["grouped_id"]
+            # Messages that failed in earlier runs, by ID (str, as stored), with attempt counts
+            failed: Dict[str, int] = checkpoint["failed"]
             
-            # Track processed groups during backfill
-            backfill_processed_groups = set()
+            # Filters can't change mid-backfill; snapshot them and bind hot methods once
+            self._refresh_config_cache()
+            filters = self._filters
+            # Disabled filters pass everything, so skip the check altogether
+            filters_active = filters.get("enabled", False)
+            should_forward = self.text_processor.should_forward_message
+            forward = self._forward_backfill
             
-            # Copy in chronological order (oldest first)
-            for message in reversed(messages):
-                # Skip if this message is part of an already-processed media group
-                if message.grouped_id:
-                    if message.grouped_id in backfill_processed_groups:
-                        self.logger.debug(
-                            f"Backfill: Skipping message {message.id} - already processed as part of group {message.grouped_id}"
-                        )
+            def record_failure(message_id: int) -> None:
+                key = str(message_id)
+                failed[key] = failed.get(key, 0) + 1
+                if failed[key] >= self.backfill_max_attempts:
+                    del failed[key]
+                    self.logger.warning(
+                        "Backfill %s -> %s: giving up on message %s after %s attempts",
+                        source, target, message_id, self.backfill_max_attempts
+                    )
+            
+            # Retry the messages that failed last time before continuing the window;
+            # the checkpoint has already moved past them
+            if failed:
+                retry_ids = sorted(int(key) for key in failed)
+                self.logger.info("Retrying %s failed backfill message(s) %s -> %s", len(retry_ids), source, target)
+                retried = await self._with_flood_retry(self.client.get_messages, source_entity, ids=retry_ids)
+                for message_id, message in zip(retry_ids, retried):
+                    if message is None:
+                        # Deleted from the source since; nothing left to copy
+                        del failed[str(message_id)]
                         continue
-                    # Mark this group as processed
-                    backfill_processed_groups.add(message.grouped_id)
-                
-                # Check filters
-                text = message.text or message.message or ""
-                filters = self.config_manager.get_filters()
-                
-                if not self.text_processor.should_forward_message(text, filters):
-                    self.logger.debug(f"Backfill message {message.id} filtered out")
-                    continue
+                    try:
+                        copied = await forward(message, source, target)
+                    except Exception as e:
+                        self.logger.error(f"Failed to copy backfill message {message_id}: {type(e).__name__}: {e}")
+                        copied = False
+                    if copied:
+                        del failed[str(message_id)]
+                    else:
+                        record_failure(message_id)
+                self._save_backfill_progress()
+            
+            # Fetching and copying run as a pipeline: the producer keeps paging through
+            # history while the copy workers send what has been fetched so far
+            workers = self.backfill_concurrency
+            # Items are (message, album members or None); None tells a worker to stop
+            queue: "asyncio.Queue[Optional[Tuple[Message, Optional[List[Message]]]]]" = asyncio.Queue(maxsize=64)
+            
+            async def produce() -> None:
+                # Skip the rest of an album that was copied before a resume
+                last_grouped_id = resume_grouped_id
+                # Album members arrive consecutively, so an album is collected here and
+                # queued once the next message shows it is complete - the copy then
+                # doesn't have to fetch the album again
+                album: Optional[List[Message]] = None
+                # A FloodWait mid-history resumes after the last message seen
+                resume_after = min_id
+                first_message = True
+                remaining = count
+                max_attempts = 8
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        # Copy in chronological order (oldest first)
+                        async for message in self.client.iter_messages(
+                            source_entity,
+                            limit=remaining,
+                            reverse=True,
+                            min_id=resume_after,
+                            max_id=max_id
+                        ):
+                            resume_after = message.id
+                            remaining -= 1
+                            at_window_start, first_message = first_message, False
+                            
+                            # Album members arrive consecutively; the first one sends the whole album
+                            grouped_id = message.grouped_id
+                            if grouped_id and grouped_id == last_grouped_id:
+                                if album is not None:
+                                    album.append(message)
+                                continue
+                            last_grouped_id = grouped_id
+                            if album is not None:
+                                await queue.put((album[0], album))
+                                album = None
+                            
+                            # Check filters on the raw text only; .text re-renders entities
+                            # and most filtered-out messages never need anything else
+                            if filters_active and not should_forward(message.message or "", filters):
+                                self.logger.debug("Backfill message %s filtered out", message.id)
+                                continue
+                            
+                            if grouped_id and not at_window_start:
+                                album = [message]
+                            else:
+                                # An album at the window's start may have older members
+                                # outside it; the copy fetches it whole instead
+                                await queue.put((message, None))
+                        break
+                    except FloodWaitError as e:
+                        if attempt == max_attempts:
+                            raise
+                        wait_time = e.seconds + random.uniform(0, 1)
+                        self.logger.warning(
+                            "FloodWaitError during backfill of %s: waiting %.1f seconds, resuming after message %s",
+                            source, wait_time, resume_after
+                        )
+                        await asyncio.sleep(wait_time)
                 
-                # Copy with retry (no delay - let retry logic handle rate limits)
-                await self.forward_message_with_retry(message, source, target, is_backfill=True)
+                if album is not None:
+                    await queue.put((album[0], album))
+                for _ in range(workers):
+                    await queue.put(None)
+            
+            in_flight: Set[int] = set()
+            unsaved = 0
+            
+            def record_progress(message: Message, copied: bool) -> None:
+                nonlocal unsaved
+                in_flight.discard(message.id)
+                # A failed message is remembered on its own, so the checkpoint can move
+                # past it and a later run retries just that message
+                if not copied:
+                    record_failure(message.id)
+                    unsaved += 1
+                # Workers take messages in order, so the checkpoint may only move past a
+                # message once nothing older is still being copied (a resume may then
+                # repeat up to workers - 1 messages, but never skips one)
+                if in_flight and min(in_flight) < message.id:
+                    return
+                checkpoint["after"] = message.id
+                checkpoint["grouped_id"] = message.grouped_id
+                unsaved += 1
+                if unsaved >= 50:
+                    unsaved = 0
+                    self._save_backfill_progress()
+            
+            async def consume() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    message, group = item
+                    in_flight.add(message.id)
+                    # Copy with retry (no delay - let retry logic handle rate limits);
+                    # a worker must outlive any one message or the producer would block
+                    # forever on the full queue
+                    try:
+                        copied = await forward(message, source, target, group=group)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to copy backfill message {message.id}: {type(e).__name__}: {e}"
+                        )
+                        copied = False
+                    record_progress(message, copied)
+            
+            consumers = [asyncio.create_task(consume()) for _ in range(workers)]
+            try:
+                # Await both sides together so an error in either surfaces right away
+                await asyncio.gather(produce(), *consumers)
+            finally:
+                for task in consumers:
+                    task.cancel()
+                if unsaved:
+                    self._save_backfill_progress()
+            
+            if failed:
+                self.logger.warning(
+                    "Backfill %s -> %s incomplete: %s message(s) failed to copy, retrying them next run",
+                    source, target, len(failed)
+                )
+                return False
+            
+            # Finished: nothing left to resume
+            if self.backfill_progress.pop(pair_key, None) is not None:
+                self._save_backfill_progress()
             
             self.logger.info(f"Backfill completed for {source} -> {target}")
+            return True
             
         except Exception as e:
             self.logger.error(
                 f"Error during backfill from {source} to {target}: {type(e).__name__}: {e}"
             )
+            return False
     
     def mark_pair_for_backfill(self, source: int, target: int) -> None:
         """
@@ -1269,15 +2073,22 @@ class TelegramForwarder:
             target: Target channel ID
         """
         pair_key = self._get_pair_key(source, target)
-        if pair_key in self.backfilled_pairs:
-            del self.backfilled_pairs[pair_key]
-            self._save_backfill_tracking()
+        try:
+            removed = self.backfill_tracking.unmark(pair_key)
+        except Exception as e:
+            self.logger.error(f"Failed to save backfill tracking: {e}")
+            return
+        if removed:
             self.logger.info(f"📍 Marked pair for backfill: {source} -> {target}")
     
     def reload_config(self) -> None:
         """Reload configuration from file."""
         self.logger.info("Reloading configuration...")
+        version = self.config_manager.version
         self.config = self.config_manager.load()
+        if self.config_manager.version == version:
+            self.logger.info("Configuration unchanged")
+            return
         self.text_processor.update_rules(self.config_manager.get_replacement_rules())
         self.logger.info("Configuration reloaded")
     
@@ -1285,22 +2096,44 @@ class TelegramForwarder:
         """Stop the bot gracefully."""
         self.logger.info("Stopping bot...")
         
+        # Stop the cleanup worker; leftovers are removed with the directory below
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+        
+        self._trigger_watcher.stop()
+        
+        # Leave a single up-to-date backfill_tracking.json behind
+        try:
+            self.backfill_tracking.compact()
+        except Exception as e:
+            self.logger.warning(f"Failed to compact backfill tracking: {e}")
+        
         # Clean up temp media directory
         if self.temp_media_dir.exists():
-            try:
-                shutil.rmtree(self.temp_media_dir)
-                self.logger.info("Cleaned up temp media directory")
-            except Exception as e:
-                self.logger.warning(f"Failed to clean up temp directory: {e}")
+            # Off the event loop so a large temp dir doesn't stall the disconnect
+            await asyncio.get_running_loop().run_in_executor(None, self._clear_temp_media_dir)
+            self.logger.info("Cleaned up temp media directory")
         
         await self.client.disconnect()
         self.logger.info("Bot stopped")
 
 
+def install_uvloop() -> bool:
+    """Use uvloop's faster event loop when it is installed. Returns True if it was."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 async def main():
     """Main entry point."""
-    import argparse
-    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Telegram Forwarder Bot')
     parser.add_argument('--config', type=str, default='config.json',
@@ -1311,10 +2144,11 @@ async def main():
     
     # Check if config is multi-worker format
     try:
+        # The constructor already loaded the config; reuse it instead of parsing again
         config_manager = ConfigManager(args.config)
-        config_data = config_manager.load()
+        config_data = config_manager.config
 
-        if "workers" in config_data and isinstance(config_data.get("workers"), list):
+        if config_manager.is_multi_worker_mode():
             # Multi-worker config detected
             print("\n" + "="*60)
             print("⚠️  MULTI-WORKER CONFIG DETECTED")
@@ -1372,4 +2206,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
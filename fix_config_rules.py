@@ -7,9 +7,12 @@ top-level replacement_rules array instead of to the worker's replacement_rules.
 """
 
 import json
+import shutil
 import sys
 from pathlib import Path
 
+from src import json_io
+
 
 def fix_config(config_path: str = "config.json"):
     """Move top-level replacement_rules to worker's replacement_rules."""
@@ -77,13 +80,11 @@ def fix_config(config_path: str = "config.json"):
     
     # Create backup
     backup_path = f"{config_path}.backup"
-    with open(backup_path, 'w') as f:
-        json.dump(json.load(open(config_path)), f, indent=2)
+    shutil.copyfile(config_path, backup_path)
     print(f"\n💾 Backup created: {backup_path}")
     
-    # Save fixed config
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Save fixed config (temp file + rename, so an interrupted run can't truncate it)
+    json_io.dump_file(config_path, config, indent=True)
     
     print(f"\n✅ Config fixed and saved!")
     print(f"\n📋 Summary:")
@@ -0,0 +1,154 @@
+"""Backfill tracking persisted as a JSON snapshot plus an append-only journal."""
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from src import json_io
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+# Don't compact while the journal is smaller than this, even for tiny snapshots
+MIN_COMPACT_SIZE = 4096
+
+# (source, target) in memory; "source:target" on disk
+PairKey = Tuple[int, int]
+
+
+def format_pair_key(pair_key: PairKey) -> str:
+    """Serialize a pair key as "source:target"."""
+    return f"{pair_key[0]}:{pair_key[1]}"
+
+
+def parse_pair_key(text: str) -> PairKey:
+    """Parse a "source:target" string (both IDs may be negative)."""
+    source, _, target = text.partition(":")
+    return int(source), int(target)
+
+
+@contextmanager
+def _locked(journal_path: Union[str, Path]) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the journal's .lock file.
+
+    The bot and the admin bot (and every worker) share these files; appends and
+    compactions take the lock so a compaction can't truncate a record that was
+    appended after it replayed the journal.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(f"{os.fspath(journal_path)}.lock", "ab") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def append_record(journal_path: Union[str, Path], record: Dict[str, Any]) -> None:
+    """Append one JSON record as a line to the journal and fsync it."""
+    with _locked(journal_path), open(journal_path, "ab", buffering=0) as f:
+        f.write(json_io.dumps(record) + b"\n")
+        os.fsync(f.fileno())
+
+
+class BackfillTracking:
+    """
+    Tracks which channel pairs have been backfilled.
+
+    backfill_tracking.json holds a {"source:target": timestamp} snapshot.
+    Changes made since the snapshot are appended to backfill_tracking.log as
+    {"op": "set"|"del", ...} lines, so marking a pair costs one small write
+    instead of rewriting the whole file. The journal is folded back into the
+    snapshot when it grows past twice the snapshot's size.
+    """
+
+    def __init__(self, snapshot_path: Union[str, Path] = "backfill_tracking.json",
+                 journal_path: Optional[Union[str, Path]] = None):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path) if journal_path else self.snapshot_path.with_suffix(".log")
+        self.pairs: Dict[PairKey, float] = {}
+        self._loaded = False
+
+    def load(self) -> Dict[PairKey, float]:
+        """Load the snapshot and replay the journal on top of it."""
+        self.pairs = self._read()
+        self._loaded = True
+        return self.pairs
+
+    def _read(self) -> Dict[PairKey, float]:
+        """Return the on-disk state: the snapshot with the journal replayed on top."""
+        pairs: Dict[PairKey, float] = {}
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "rb") as f:
+                for key, timestamp in json_io.loads(f.read()).items():
+                    pairs[parse_pair_key(key)] = timestamp
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json_io.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line from a crash mid-append
+                        continue
+                    if record.get("op") == "set":
+                        pairs[parse_pair_key(record["key"])] = record["ts"]
+                    elif record.get("op") == "del":
+                        pairs.pop(parse_pair_key(record["key"]), None)
+        return pairs
+
+    def mark(self, pair_key: PairKey, timestamp: float) -> None:
+        """Record a pair as backfilled."""
+        self.pairs[pair_key] = timestamp
+        self._append({"op": "set", "key": format_pair_key(pair_key), "ts": timestamp})
+
+    def unmark(self, pair_key: PairKey) -> bool:
+        """Forget a pair so it gets backfilled again. Returns False if it wasn't tracked."""
+        if self.pairs.pop(pair_key, None) is None:
+            return False
+        self._append({"op": "del", "key": format_pair_key(pair_key)})
+        return True
+
+    def compact(self) -> None:
+        """
+        Fold the journal into the snapshot and empty it.
+
+        The state written is re-read from disk under the lock, not taken from
+        self.pairs, so records other processes appended since our load survive.
+        self.pairs is updated in place to match.
+        """
+        with _locked(self.journal_path):
+            pairs = self._read()
+            json_io.dump_file(
+                self.snapshot_path,
+                {format_pair_key(key): ts for key, ts in pairs.items()},
+                indent=True
+            )
+            # Replaying a journal that survives a crash right here is harmless:
+            # the snapshot already reflects every record in it
+            open(self.journal_path, "wb").close()
+        self.pairs.clear()
+        self.pairs.update(pairs)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Journal a record, compacting once the journal outgrows the snapshot."""
+        append_record(self.journal_path, record)
+        if self._loaded and self._needs_compaction():
+            self.compact()
+
+    def _needs_compaction(self) -> bool:
+        try:
+            journal_size = self.journal_path.stat().st_size
+        except OSError:
+            return False
+        try:
+            snapshot_size = self.snapshot_path.stat().st_size
+        except OSError:
+            snapshot_size = 0
+        return journal_size > 2 * max(snapshot_size, MIN_COMPACT_SIZE)
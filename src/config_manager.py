@@ -1,10 +1,11 @@
 """Configuration manager for the Telegram forwarder bot."""
-import json
 import os
 import sqlite3
 import threading
 from typing import Dict, List, Any, Optional, Tuple
 
+from src import json_io
+
 
 DEFAULT_FILTERS = {
     "enabled": False,
@@ -49,6 +50,13 @@ class ConfigManager:
         self._lock = threading.RLock()
         self._dict_mode = False
         self._config_mode = "single"
+        # Bumped whenever the config is reloaded or saved so callers can cache derived data
+        self.version = 0
+        # (mtime_ns, size) of config.json and config.db as of the last rebuild
+        self._storage_stamp: Optional[Tuple[Any, ...]] = None
+        # source -> targets of the enabled pairs, and the version it was built for
+        self._source_index: Dict[int, Tuple[int, ...]] = {}
+        self._source_index_version = -1
 
         if isinstance(config_path_or_dict, dict):
             self._dict_mode = True
@@ -68,6 +76,11 @@ class ConfigManager:
             if self._dict_mode:
                 return self.config
 
+            # Skip the parse and rebuild when neither file changed since the last load
+            stamp = self._read_storage_stamp()
+            if stamp == self._storage_stamp:
+                return self.config
+
             admin_config, full_config = self._load_json_config()
             self._init_db()
 
@@ -77,12 +90,27 @@ class ConfigManager:
                 admin_config, _ = self._load_json_config()
 
             self.config = self._build_config_from_db(admin_config)
+            self._storage_stamp = stamp
+            self.version += 1
             return self.config
 
+    def _read_storage_stamp(self) -> Tuple[Any, ...]:
+        """Return (mtime_ns, size) for config.json and config.db, None for a missing file."""
+        stamp = []
+        for path in (self.config_path, self.db_path):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except (OSError, TypeError):
+                stamp.append(None)
+        return tuple(stamp)
+
     def save(self) -> None:
         """Save configuration to SQLite and admin JSON."""
         with self._lock:
             if self._dict_mode:
+                # Nothing to write, but in-memory edits still invalidate cached data
+                self.version += 1
                 return
             admin_config = {
                 "admin_bot_token": self.config.get("admin_bot_token", ""),
@@ -90,6 +118,7 @@ class ConfigManager:
             }
             self._save_admin_config(admin_config)
             self._write_db_from_config(self.config)
+            self.version += 1
 
     def _load_json_config(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Load admin config from JSON; return (admin_config, full_config)."""
@@ -102,8 +131,8 @@ class ConfigManager:
             self._save_admin_config(admin_config)
             return admin_config, dict(admin_config)
 
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            full_config = json.load(f)
+        with open(self.config_path, "rb") as f:
+            full_config = json_io.loads(f.read())
 
         admin_config = {
             "admin_bot_token": full_config.get("admin_bot_token", ""),
@@ -119,8 +148,7 @@ class ConfigManager:
             "admin_bot_token": admin_config.get("admin_bot_token", ""),
             "admin_user_ids": admin_config.get("admin_user_ids", [])
         }
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(safe_admin, f, indent=2, ensure_ascii=False)
+        json_io.dump_file(self.config_path, safe_admin, indent=True)
 
     def _should_migrate(self, full_config: Dict[str, Any]) -> bool:
         """Detect legacy JSON config that needs migration."""
@@ -330,7 +358,7 @@ class ConfigManager:
                         worker_id,
                         1 if filters.get("enabled", False) else 0,
                         filters.get("mode", "whitelist"),
-                        json.dumps(filters.get("keywords", []))
+                        json_io.dumps(filters.get("keywords", [])).decode("utf-8")
                     )
                 )
 
@@ -441,7 +469,7 @@ class ConfigManager:
                     filters.update({
                         "enabled": bool(filter_row["enabled"]),
                         "mode": filter_row["mode"],
-                        "keywords": json.loads(filter_row["keywords_json"]) if filter_row["keywords_json"] else []
+                        "keywords": json_io.loads(filter_row["keywords_json"]) if filter_row["keywords_json"] else []
                     })
 
                 settings = dict(DEFAULT_SETTINGS)
@@ -543,6 +571,18 @@ class ConfigManager:
         pairs = self.config.get("channel_pairs", [])
         return [pair for pair in pairs if pair.get("enabled", True)]
 
+    def get_targets_for(self, source: int) -> Tuple[int, ...]:
+        """Get the target IDs of the enabled pairs for a source channel."""
+        version = self.version
+        if self._source_index_version != version:
+            with self._lock:
+                index: Dict[int, List[int]] = {}
+                for pair in self.get_channel_pairs():
+                    index.setdefault(pair["source"], []).append(pair["target"])
+                self._source_index = {source_id: tuple(targets) for source_id, targets in index.items()}
+                self._source_index_version = version
+        return self._source_index.get(source, ())
+
     def get_all_channel_pairs(self) -> List[Dict[str, Any]]:
         """Get all channel pairs including disabled ones."""
         if self.is_multi_worker_mode():
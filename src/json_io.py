@@ -0,0 +1,74 @@
+"""JSON helpers that use orjson when it is installed, stdlib json otherwise."""
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_file(path: Union[str, "os.PathLike[str]"], obj: Any, indent: bool = False) -> None:
+    """
+    Write an object as JSON to path atomically.
+
+    The document goes to a temp file next to path, is fsynced and then renamed
+    over path, so readers (and a crash mid-write) never see a partial file.
+    The file keeps path's permission bits (config.json holds the bot token);
+    a new file is created 0600.
+    """
+    tmp_path = f"{os.fspath(path)}.tmp.{os.getpid()}"
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o600
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):
+                # os.open's mode is narrowed by the umask; match path exactly
+                os.fchmod(f.fileno(), mode)
+            f.write(dumps(obj, indent=indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
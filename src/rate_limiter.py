@@ -0,0 +1,47 @@
+"""Async token-bucket rate limiting for outgoing Telegram requests."""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket allowing `rate` acquisitions per `per` seconds.
+
+    Bursts of up to `rate` requests go through immediately; after that callers
+    wait (in FIFO order) until enough tokens have been refilled.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = float(rate)
+        self.per = float(per)
+        self._tokens = self.rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for it to become available if needed."""
+        async with self._lock:
+            self._refill()
+            # Re-check after each sleep: penalize() may have pushed the bucket into debt meanwhile
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def penalize(self, seconds: float) -> None:
+        """Put the bucket into debt so the next acquisition waits about `seconds`."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate / self.per
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -1,34 +1,34 @@
 """Text processing module for applying replacement rules."""
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Pattern, Tuple
 
 
 class TextProcessor:
     """Handles text replacement rules for message content."""
     
     def __init__(self, replacement_rules: List[Dict[str, Any]]):
-        self.replacement_rules = replacement_rules
+        # Lowercased filter keywords, cached for the keyword list they came from
+        self._keywords_source: Optional[Tuple[str, ...]] = None
+        self._keywords_lower: Tuple[str, ...] = ()
+        self.update_rules(replacement_rules)
     
     def update_rules(self, replacement_rules: List[Dict[str, Any]]) -> None:
-        """Update the replacement rules."""
+        """Update the replacement rules and precompile their patterns."""
         self.replacement_rules = replacement_rules
+        self._compiled_rules = self._compile_rules(replacement_rules)
     
-    def process_text(self, text: Optional[str]) -> Optional[str]:
+    def _compile_rules(self, replacement_rules: List[Dict[str, Any]]) -> List[Tuple[Optional[Pattern], str, str]]:
         """
-        Apply all replacement rules to the given text.
+        Compile rules into (pattern, find, replace) tuples, kept in rule order.
         
-        Args:
-            text: The text to process
-            
-        Returns:
-            Processed text with all replacements applied
+        Rules stay separate passes rather than one alternation so that later
+        rules still see the output of earlier ones, and per-rule flags and
+        group references in replacements keep working. A pattern of None
+        means a plain case-sensitive str.replace.
         """
-        if not text:
-            return text
-        
-        processed = text
+        compiled = []
         
-        for rule in self.replacement_rules:
+        for rule in replacement_rules:
             find = rule.get("find", "")
             replace = rule.get("replace", "")
             case_sensitive = rule.get("case_sensitive", False)
@@ -41,20 +41,43 @@ class TextProcessor:
                 if is_regex:
                     # Use regex pattern directly (user must provide valid regex)
                     flags = 0 if case_sensitive else re.IGNORECASE
-                    pattern = re.compile(find, flags)
-                    processed = pattern.sub(replace, processed)
-                else:
+                    compiled.append((re.compile(find, flags), find, replace))
+                elif case_sensitive:
                     # Exact string replacement
-                    if case_sensitive:
-                        processed = processed.replace(find, replace)
-                    else:
-                        # Case-insensitive replacement (escape special chars)
-                        pattern = re.compile(re.escape(find), re.IGNORECASE)
-                        processed = pattern.sub(replace, processed)
+                    compiled.append((None, find, replace))
+                else:
+                    # Case-insensitive replacement (escape special chars)
+                    compiled.append((re.compile(re.escape(find), re.IGNORECASE), find, replace))
             except re.error as e:
                 # Invalid regex pattern - log and skip this rule
                 print(f"⚠️ Invalid regex pattern '{find}': {e}")
+        
+        return compiled
+    
+    def process_text(self, text: Optional[str]) -> Optional[str]:
+        """
+        Apply all replacement rules to the given text.
+        
+        Args:
+            text: The text to process
+            
+        Returns:
+            Processed text with all replacements applied
+        """
+        if not text:
+            return text
+        
+        processed = text
+        
+        for pattern, find, replace in self._compiled_rules:
+            if pattern is None:
+                processed = processed.replace(find, replace)
                 continue
+            try:
+                processed = pattern.sub(replace, processed)
+            except re.error as e:
+                # Invalid replacement template (e.g. bad group reference) - skip this rule
+                print(f"⚠️ Invalid replacement '{replace}' for pattern '{find}': {e}")
         
         return processed
     
@@ -83,7 +106,7 @@ class TextProcessor:
         mode = filters.get("mode", "whitelist")
         text_lower = text.lower()
         
-        has_keyword = any(keyword.lower() in text_lower for keyword in keywords)
+        has_keyword = any(keyword in text_lower for keyword in self._lowered_keywords(keywords))
         
         if mode == "whitelist":
             # In whitelist mode, forward only if message contains at least one keyword
@@ -92,6 +115,15 @@ class TextProcessor:
             # In blacklist mode, forward only if message doesn't contain any keyword
             return not has_keyword
     
+    def _lowered_keywords(self, keywords: List[str]) -> Tuple[str, ...]:
+        """Return the keywords lowercased, redoing it only when the keywords change."""
+        # Keyed on the contents, so edits made in place to the same list are picked up
+        source = tuple(keywords)
+        if source != self._keywords_source:
+            self._keywords_lower = tuple(keyword.lower() for keyword in source)
+            self._keywords_source = source
+        return self._keywords_lower
+    
     def split_long_message(self, text: str, max_length: int = 4096) -> List[str]:
         """
         Split a long message into multiple parts if it exceeds max_length.
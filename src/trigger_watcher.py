@@ -0,0 +1,90 @@
+"""Event-driven watching of the admin bot's reload trigger file (inotify on Linux)."""
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Union
+
+# inotify event masks (from <sys/inotify.h>)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class TriggerWatcher:
+    """
+    Sets `event` when the trigger file is created or touched.
+
+    Watches the file's directory with inotify through the event loop's
+    add_reader, so nothing runs until the file actually changes. When inotify
+    isn't available (non-Linux, no libc), start() returns False, `active`
+    stays False and callers should keep checking for the file themselves.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.event = asyncio.Event()
+        self.active = False
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> bool:
+        """Start watching; returns whether inotify is in use."""
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return False
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return False
+
+        fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return False
+        directory = os.fsencode(str(self.path.parent.resolve()))
+        if inotify_add_watch(fd, directory, IN_CREATE | IN_MOVED_TO | IN_CLOSE_WRITE | IN_ATTRIB) < 0:
+            os.close(fd)
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+        self._fd = fd
+        self.active = True
+
+        # The file may have been dropped before we started watching
+        if self.path.exists():
+            self.event.set()
+        return True
+
+    def stop(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        if self._fd is None:
+            return
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+        self.active = False
+
+    def _on_readable(self) -> None:
+        """Drain pending inotify events and set `event` if any concern the trigger file."""
+        try:
+            data = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return
+
+        name = os.fsencode(self.path.name)
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, _, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if data[offset:offset + name_len].rstrip(b"\0") == name:
+                self.event.set()
+            offset += name_len
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
-from bot import TelegramForwarder
+from bot import TelegramForwarder, install_uvloop
 from src.logger_setup import setup_logger
 from src.config_manager import ConfigManager
 
@@ -93,6 +93,7 @@ def run_worker(worker_id: str, worker_config: Dict):
         # Run the forwarder bot with config dict directly (no file created!)
         # CRITICAL: Explicitly create and set event loop for subprocess
         # asyncio.run() doesn't work well with Telethon in multiprocessing
+        install_uvloop()
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         